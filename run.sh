@@ -1,5 +1,2 @@
 #!/usr/bin/env bash
-for f in src/solutions/*.py; do
-  echo -e "\nRunning $f:"
-  python "$f"
-done
+PYTHONPATH="$PWD/src${PYTHONPATH:+:$PYTHONPATH}" python -m runner "$@"
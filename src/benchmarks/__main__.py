@@ -0,0 +1,122 @@
+import argparse
+import json
+import os
+import platform
+import time
+from dataclasses import asdict
+
+from benchmarks.suite import DayBenchmark, benchmark_day, find_regressions
+from runner.registry import discover_days, parse_day_filter
+from utils.inputs import set_parse_cache
+
+DEFAULT_BASELINE = os.path.normpath(
+    os.path.join(os.path.dirname(__file__), "../../.cache/benchmarks/baseline.json")
+)
+
+
+def format_benchmark(benchmark: DayBenchmark) -> str:
+    """
+    format_benchmark format the benchmark of a day as a report row
+
+    Args:
+        benchmark (DayBenchmark): the benchmark of the day
+
+    Returns:
+        str: the report row
+    """
+    runs = "  ".join(f"x{run.factor} {run.seconds:.4f}s" for run in benchmark.runs)
+    exponent = "-" if benchmark.exponent is None else f"{benchmark.exponent:.2f}"
+    row = f"day {benchmark.day:>2}  exponent {exponent:>5}  {runs}"
+    if benchmark.skipped:
+        row += f"  skipped {', '.join(f'x{factor}' for factor in benchmark.skipped)}"
+    if benchmark.error:
+        row += f"  error {benchmark.error}"
+    return row
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="benchmarks",
+        description="Benchmark the days on generated inputs and fit their complexity.",
+    )
+    parser.add_argument(
+        "days", nargs="*", help="days or ranges to run (ex: 1 3 8-11), default all"
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=[1, 10, 100, 1000],
+        help="factors to scale the inputs by, default 1 10 100 1000",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="runs per size, the fastest is kept"
+    )
+    parser.add_argument(
+        "--budget",
+        type=float,
+        default=10.0,
+        help="skip the sizes predicted to run longer than this many seconds",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="seed of the input generators, default 0"
+    )
+    parser.add_argument(
+        "--baseline",
+        default=DEFAULT_BASELINE,
+        help=f"the baseline JSON file, default {DEFAULT_BASELINE}",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="write the results as the new baseline"
+    )
+    parser.add_argument(
+        "--parse-cache",
+        action="store_true",
+        help="let the parsers use the on-disk cache, off by default",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=20.0,
+        help="fail when a run is this many percent slower than the baseline",
+    )
+    args = parser.parse_args()
+
+    try:
+        days = parse_day_filter(args.days, discover_days())
+    except ValueError as error:
+        parser.error(str(error))
+
+    set_parse_cache(args.parse_cache)
+    benchmarks = []
+    for day in days:
+        benchmark = benchmark_day(
+            day, args.sizes, args.repeat, args.budget, args.seed
+        )
+        print(format_benchmark(benchmark), flush=True)
+        benchmarks.append(benchmark)
+
+    if args.save:
+        baseline = {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "days": {str(benchmark.day): asdict(benchmark) for benchmark in benchmarks},
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(args.baseline)), exist_ok=True)
+        with open(args.baseline, "w") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"Saved the baseline to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}, run with --save to create one")
+        return 0
+    with open(args.baseline) as f:
+        regressions = find_regressions(benchmarks, json.load(f), args.threshold)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,217 @@
+import argparse
+import io
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from benchmarks.generators import generate_text
+from runner.registry import get_solve_function, load_day_module, parse_day_filter
+from utils.inputs import set_parse_cache
+
+# The faster engines of each day, compared to the day's reference solution
+ENGINES: dict[int, tuple[str, ...]] = {
+    1: ("incremental", "solve_streaming", "solve_numpy"),
+    2: ("incremental", "solve_histogram"),
+    3: ("incremental", "solve_bitmask", "solve_numpy"),
+    4: ("incremental",),
+    7: ("solve_fast",),
+    9: ("solve_fast",),
+    10: ("solve_fast",),
+}
+
+TSolve = Callable[[str], Any]
+
+
+@dataclass
+class Outcome:
+    value: Any = None
+    error: str | None = None
+    seconds: float = field(default=0.0, compare=False)
+
+    def __str__(self) -> str:
+        return f"raised {self.error}" if self.error else repr(self.value)
+
+
+@dataclass
+class FuzzReport:
+    day: int
+    engine: str
+    inputs: int = 0
+    reference_time: float = 0.0
+    engine_time: float = 0.0
+    mismatch: str | None = None
+    skipped: bool = False
+    expected: Outcome | None = None
+    actual: Outcome | None = None
+
+    @property
+    def speedup(self) -> float | None:
+        return self.reference_time / self.engine_time if self.engine_time else None
+
+
+def run_quietly(solve: TSolve, raw_input: str) -> Outcome:
+    """
+    run_quietly run a solution without its printed output, keeping the error
+    it raised as its outcome so a reference and an engine failing alike agree
+
+    Args:
+        solve (TSolve): the solution to run
+        raw_input (str): the input to solve
+
+    Returns:
+        Outcome: the answer or the type of the error, and the time it took
+    """
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(io.StringIO()):
+            outcome = Outcome(value=solve(raw_input))
+    except Exception as error:
+        outcome = Outcome(error=type(error).__name__)
+    outcome.seconds = time.perf_counter() - start
+    return outcome
+
+
+def shrink_input(raw_input: str, is_failing: Callable[[str], bool]) -> str:
+    """
+    shrink_input shrink a failing input by deleting lines, first in large chunks
+    then line by line, as long as the input keeps failing
+
+    Args:
+        raw_input (str): the failing input
+        is_failing (Callable[[str], bool]): whether an input still fails
+
+    Returns:
+        str: the smallest failing input found, every line of it needed to fail
+    """
+    lines = raw_input.splitlines()
+    chunk_size = max(len(lines) // 2, 1)
+    while True:
+        index = 0
+        while index < len(lines):
+            candidate = lines[:index] + lines[index + chunk_size :]
+            if candidate and is_failing("\n".join(candidate)):
+                lines = candidate
+            else:
+                index += chunk_size
+        if chunk_size == 1:
+            return "\n".join(lines)
+        chunk_size //= 2
+
+
+def fuzz_engine(
+    day: int, engine_name: str, sizes: list[int], rounds: int, seed: int = 0
+) -> FuzzReport:
+    """
+    fuzz_engine compare an engine to the reference solution of its day on random
+    inputs of growing size, and shrink the first mismatch to a minimal input
+
+    Args:
+        day (int): the day number
+        engine_name (str): the name of the engine in the day module
+        sizes (list[int]): the approximate sizes of the inputs in bytes
+        rounds (int): the number of inputs of each size
+        seed (int): the seed of the first input
+
+    Returns:
+        FuzzReport: the number of inputs compared, the time of both solutions
+        and the minimal mismatching input if any, or skipped if the engine needs
+        an optional dependency that is not installed
+    """
+    module = load_day_module(day)
+    reference, engine = get_solve_function(module), getattr(module, engine_name)
+    report = FuzzReport(day, engine_name)
+
+    def is_failing(raw_input: str) -> bool:
+        return run_quietly(reference, raw_input) != run_quietly(engine, raw_input)
+
+    for size in sizes:
+        for round_index in range(rounds):
+            raw_input = generate_text(day, size, seed + round_index)
+            expected = run_quietly(reference, raw_input)
+            actual = run_quietly(engine, raw_input)
+            if actual.error == "ModuleNotFoundError":
+                report.skipped = True
+                return report
+            report.inputs += 1
+            report.reference_time += expected.seconds
+            report.engine_time += actual.seconds
+            if expected != actual:
+                report.mismatch = shrink_input(raw_input, is_failing)
+                report.expected = run_quietly(reference, report.mismatch)
+                report.actual = run_quietly(engine, report.mismatch)
+                return report
+        seed += rounds
+    return report
+
+
+def format_report(report: FuzzReport) -> str:
+    """
+    format_report format the result of the fuzzing of an engine
+
+    Args:
+        report (FuzzReport): the result of the fuzzing
+
+    Returns:
+        str: the report row, followed by the minimal input of a mismatch
+    """
+    speedup = "-" if report.speedup is None else f"x{report.speedup:.1f}"
+    row = (
+        f"day {report.day:>2}  {report.engine:<24} {report.inputs:>4} inputs  "
+        f"reference {report.reference_time:8.3f}s  engine {report.engine_time:8.3f}s"
+        f"  speedup {speedup:>7}  "
+    )
+    if report.skipped:
+        return row + "SKIPPED (missing optional dependency)"
+    if report.mismatch is None:
+        return row + "OK"
+    return (
+        row
+        + "MISMATCH\n"
+        + f"expected {report.expected}\nactual   {report.actual}\n"
+        + f"minimal input:\n{report.mismatch}"
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="benchmarks.fuzz",
+        description="Compare the faster engines to the reference solutions.",
+    )
+    parser.add_argument(
+        "days",
+        nargs="*",
+        help="days or ranges to fuzz (ex: 7 9-10), default all with an engine",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=[100, 1_000, 10_000],
+        help="approximate sizes of the inputs in bytes, default 100 1000 10000",
+    )
+    parser.add_argument(
+        "--rounds", type=int, default=5, help="inputs per size, default 5"
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="seed of the first input, default 0"
+    )
+    args = parser.parse_args()
+
+    try:
+        days = parse_day_filter(args.days, sorted(ENGINES))
+    except ValueError as error:
+        parser.error(str(error))
+
+    set_parse_cache(False)
+    failed = False
+    for day in days:
+        for engine_name in ENGINES[day]:
+            report = fuzz_engine(day, engine_name, args.sizes, args.rounds, args.seed)
+            print(format_report(report), flush=True)
+            failed = failed or report.mismatch is not None
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,406 @@
+import argparse
+import math
+import string
+import sys
+from random import Random
+from typing import Callable, Iterator
+
+from solutions.day5 import get_initial_stack_state
+
+TGenerator = Callable[[int, Random], Iterator[str]]
+
+
+def generate_day1(size: int, rng: Random) -> Iterator[str]:
+    """
+    generate_day1 generate the calories of the elves, one paragraph per elf
+
+    Args:
+        size (int): the approximate size of the input in bytes
+        rng (Random): the random number generator
+
+    Returns:
+        Iterator[str]: the chunks of the input
+    """
+    written = 0
+    while written < size:
+        calories = [rng.randint(1000, 60000) for _ in range(rng.randint(1, 15))]
+        paragraph = "\n".join(map(str, calories)) + "\n\n"
+        written += len(paragraph)
+        yield paragraph
+
+
+def generate_day2(size: int, rng: Random) -> Iterator[str]:
+    """
+    generate_day2 generate rock paper scissors rounds (ex: "A Y")
+
+    Args:
+        size (int): the approximate size of the input in bytes
+        rng (Random): the random number generator
+
+    Returns:
+        Iterator[str]: the chunks of the input
+    """
+    for _ in range(math.ceil(size / 4)):
+        yield f"{rng.choice('ABC')} {rng.choice('XYZ')}\n"
+
+
+def generate_rucksack(
+    letters: list[str], badge: str, rng: Random, max_compartment_size: int
+) -> str:
+    """
+    generate_rucksack generate a rucksack whose compartments share exactly one item
+    and that holds the badge of its group
+
+    Args:
+        letters (list[str]): the items only this rucksack of the group may hold
+        badge (str): the badge of the group
+        rng (Random): the random number generator
+        max_compartment_size (int): the maximum number of items per compartment
+
+    Returns:
+        str: the rucksack
+    """
+    shared, *rest = letters
+    left_items, right_items = rest[: len(rest) // 2], rest[len(rest) // 2 :]
+    compartment_size = rng.randint(2, max_compartment_size)
+    left = [shared, *rng.choices(left_items, k=compartment_size - 1)]
+    right = [shared, *rng.choices(right_items, k=compartment_size - 1)]
+    rng.choice([left, right])[1] = badge
+    rng.shuffle(left)
+    rng.shuffle(right)
+    return "".join(left + right)
+
+
+def generate_day3(size: int, rng: Random) -> Iterator[str]:
+    """
+    generate_day3 generate groups of three rucksacks, each group sharing one badge
+
+    Args:
+        size (int): the approximate size of the input in bytes
+        rng (Random): the random number generator
+
+    Returns:
+        Iterator[str]: the chunks of the input
+    """
+    written = 0
+    while written < size:
+        badge, *letters = rng.sample(string.ascii_letters, len(string.ascii_letters))
+        pool_size = len(letters) // 3
+        group = "".join(
+            generate_rucksack(letters[i : i + pool_size], badge, rng, 16) + "\n"
+            for i in range(0, pool_size * 3, pool_size)
+        )
+        written += len(group)
+        yield group
+
+
+def generate_day4(size: int, rng: Random) -> Iterator[str]:
+    """
+    generate_day4 generate pairs of section assignments (ex: "2-4,6-8")
+
+    Args:
+        size (int): the approximate size of the input in bytes
+        rng (Random): the random number generator
+
+    Returns:
+        Iterator[str]: the chunks of the input
+    """
+    written = 0
+    while written < size:
+        first_start, first_end = sorted(rng.randint(1, 99) for _ in range(2))
+        second_start, second_end = sorted(rng.randint(1, 99) for _ in range(2))
+        line = f"{first_start}-{first_end},{second_start}-{second_end}\n"
+        written += len(line)
+        yield line
+
+
+def generate_day5(size: int, rng: Random) -> Iterator[str]:
+    """
+    generate_day5 generate crane moves that are valid for the day 5 stacks
+    and leave no stack empty
+
+    Args:
+        size (int): the approximate size of the input in bytes
+        rng (Random): the random number generator
+
+    Returns:
+        Iterator[str]: the chunks of the input
+    """
+    initial_state = get_initial_stack_state()
+    heights = {stack: len(crates) for stack, crates in initial_state.items()}
+
+    def move(count: int, from_stack: int, to_stack: int) -> str:
+        heights[from_stack] -= count
+        heights[to_stack] += count
+        return f"move {count} from {from_stack} to {to_stack}\n"
+
+    written = 0
+    while written < size:
+        from_stack = rng.choice([stack for stack, height in heights.items() if height])
+        to_stack = rng.choice([stack for stack in heights if stack != from_stack])
+        line = move(rng.randint(1, min(heights[from_stack], 10)), from_stack, to_stack)
+        written += len(line)
+        yield line
+
+    for stack in heights:
+        if not heights[stack]:
+            yield move(1, max(heights, key=heights.__getitem__), stack)
+
+
+def generate_day6(size: int, rng: Random) -> Iterator[str]:
+    """
+    generate_day6 generate a datastream whose packet marker is in the middle
+    and whose message marker is at the end
+
+    Args:
+        size (int): the approximate size of the input in bytes
+        rng (Random): the random number generator
+
+    Returns:
+        Iterator[str]: the chunks of the input
+    """
+    chunk_size = 65536
+    half = max(size // 2, 1)
+    for written in range(0, half, chunk_size):
+        yield "".join(rng.choices("abc", k=min(chunk_size, half - written)))
+    yield "wxyz"
+    for written in range(0, half, chunk_size):
+        yield "".join(rng.choices("abc", k=min(chunk_size, half - written)))
+    yield "defghijklmnopq\n"
+
+
+def generate_day7(size: int, rng: Random) -> Iterator[str]:
+    """
+    generate_day7 generate a terminal log exploring a random file system
+    with nested `cd` and `ls` commands
+
+    Args:
+        size (int): the approximate size of the input in bytes
+        rng (Random): the random number generator
+
+    Returns:
+        Iterator[str]: the chunks of the input
+    """
+    written = 0
+
+    def explore_folder(depth: int, max_subfolders: int) -> Iterator[str]:
+        nonlocal written
+        subfolders = [
+            f"{''.join(rng.choices(string.ascii_lowercase, k=5))}{index}"
+            for index in range(rng.randint(0, max_subfolders))
+        ]
+        listing = ["$ ls"] + [f"dir {name}" for name in subfolders]
+        listing += [
+            f"{rng.randint(1000, 300_000)} {rng.choice(string.ascii_lowercase)}{i}.txt"
+            for i in range(rng.randint(1, 5))
+        ]
+        chunk = "\n".join(listing) + "\n"
+        written += len(chunk)
+        yield chunk
+        for name in subfolders:
+            if written >= size:
+                return
+            yield f"$ cd {name}\n"
+            yield from explore_folder(depth + 1, 3 if depth < 8 else 0)
+            yield "$ cd ..\n"
+            written += len(name) + 13
+
+    yield "$ cd /\n"
+    while written < size:
+        yield from explore_folder(1, 3)
+        yield "$ cd /\n"
+
+
+def generate_day8(size: int, rng: Random, columns: int | None = None) -> Iterator[str]:
+    """
+    generate_day8 generate a grid of tree heights, square by default
+
+    Args:
+        size (int): the approximate size of the input in bytes
+        rng (Random): the random number generator
+        columns (int | None): the number of columns of the grid
+
+    Returns:
+        Iterator[str]: the chunks of the input
+    """
+    columns = columns or max(math.isqrt(size), 2)
+    for _ in range(max(math.ceil(size / (columns + 1)), 2)):
+        yield "".join(rng.choices(string.digits, k=columns)) + "\n"
+
+
+def generate_day9(size: int, rng: Random) -> Iterator[str]:
+    """
+    generate_day9 generate the moves of the head of the rope (ex: "R 4")
+
+    Args:
+        size (int): the approximate size of the input in bytes
+        rng (Random): the random number generator
+
+    Returns:
+        Iterator[str]: the chunks of the input
+    """
+    written = 0
+    while written < size:
+        line = f"{rng.choice('RLUD')} {rng.randint(1, 20)}\n"
+        written += len(line)
+        yield line
+
+
+def generate_day10(size: int, rng: Random) -> Iterator[str]:
+    """
+    generate_day10 generate a program of `addx` and `noop` instructions
+    that runs for at least the 240 cycles the screen needs
+
+    Args:
+        size (int): the approximate size of the input in bytes
+        rng (Random): the random number generator
+
+    Returns:
+        Iterator[str]: the chunks of the input
+    """
+    written, cycles = 0, 0
+    while written < size or cycles < 240:
+        if rng.random() < 0.3:
+            line, cycles = "noop\n", cycles + 1
+        else:
+            line, cycles = f"addx {rng.randint(-10, 10)}\n", cycles + 2
+        written += len(line)
+        yield line
+
+
+def generate_day11(size: int, rng: Random) -> Iterator[str]:
+    """
+    generate_day11 generate monkey specifications, spreading the extra size
+    over their starting items
+
+    Args:
+        size (int): the approximate size of the input in bytes
+        rng (Random): the random number generator
+
+    Returns:
+        Iterator[str]: the chunks of the input
+    """
+    primes = [2, 3, 5, 7, 11, 13, 17, 19]
+    monkeys = max(2, min(len(primes), size // 160))
+    items_per_monkey = max(1, (size - monkeys * 150) // (monkeys * 4))
+    denominators = rng.sample(primes, monkeys)
+    square_monkey = rng.randrange(monkeys)
+    for monkey in range(monkeys):
+        yield f"Monkey {monkey}:\n  Starting items: "
+        for start in range(0, items_per_monkey, 4096):
+            count = min(4096, items_per_monkey - start)
+            items = ", ".join(str(rng.randint(50, 99)) for _ in range(count))
+            yield items if start == 0 else ", " + items
+        if monkey == square_monkey:
+            operation = "old * old"
+        else:
+            operation = f"old {rng.choice('+*')} {rng.randint(1, 9)}"
+        others = [other for other in range(monkeys) if other != monkey]
+        if_true, if_false = rng.sample(others, 2) if len(others) > 1 else others * 2
+        yield (
+            f"\n  Operation: new = {operation}\n"
+            f"  Test: divisible by {denominators[monkey]}\n"
+            f"    If true: throw to monkey {if_true}\n"
+            f"    If false: throw to monkey {if_false}\n\n"
+        )
+
+
+GENERATORS: dict[int, TGenerator] = {
+    1: generate_day1,
+    2: generate_day2,
+    3: generate_day3,
+    4: generate_day4,
+    5: generate_day5,
+    6: generate_day6,
+    7: generate_day7,
+    8: generate_day8,
+    9: generate_day9,
+    10: generate_day10,
+    11: generate_day11,
+}
+
+
+def generate_input(day: int, size: int, seed: int = 0) -> Iterator[str]:
+    """
+    generate_input generate a valid input for a day, chunk by chunk
+
+    Args:
+        day (int): the day number
+        size (int): the approximate size of the input in bytes
+        seed (int): the seed of the random number generator
+
+    Returns:
+        Iterator[str]: the chunks of the input
+    """
+    return GENERATORS[day](size, Random(seed))
+
+
+def generate_text(day: int, size: int, seed: int = 0) -> str:
+    """
+    generate_text generate a valid input for a day as a string,
+    stripped like the inputs returned by read_inputs
+
+    Args:
+        day (int): the day number
+        size (int): the approximate size of the input in bytes
+        seed (int): the seed of the random number generator
+
+    Returns:
+        str: the input
+    """
+    return "".join(generate_input(day, size, seed)).strip()
+
+
+def write_input(day: int, path: str, size: int, seed: int = 0) -> int:
+    """
+    write_input stream a valid input for a day to a file
+
+    Args:
+        day (int): the day number
+        path (str): the path of the file, "-" for stdout
+        size (int): the approximate size of the input in bytes
+        seed (int): the seed of the random number generator
+
+    Returns:
+        int: the number of characters written
+    """
+    chunks = generate_input(day, size, seed)
+    if path == "-":
+        return sum(sys.stdout.write(chunk) for chunk in chunks)
+    with open(path, "w") as f:
+        return sum(f.write(chunk) for chunk in chunks)
+
+
+def parse_size(size: str) -> int:
+    """
+    parse_size parse a size with an optional unit (ex: "10K", "1.5M", "2G")
+
+    Args:
+        size (str): the size
+
+    Returns:
+        int: the size in bytes
+    """
+    units = {"K": 1024, "M": 1024**2, "G": 1024**3}
+    unit = size[-1:].upper()
+    if unit in units:
+        return int(float(size[:-1]) * units[unit])
+    return int(size)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="benchmarks.generators",
+        description="Generate a large valid input for a day.",
+    )
+    parser.add_argument("day", type=int, choices=sorted(GENERATORS))
+    parser.add_argument("size", type=parse_size, help="approximate size (ex: 1G)")
+    parser.add_argument("-o", "--output", default="-", help="output file or '-'")
+    parser.add_argument("--seed", type=int, default=0, help="random seed, default 0")
+    args = parser.parse_args()
+    write_input(args.day, args.output, args.size, args.seed)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,206 @@
+import argparse
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+
+from runner.registry import SOLUTIONS_DIR, discover_days, parse_day_filter
+
+SOURCE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+@dataclass
+class ImportRecord:
+    module: str
+    self_time: float
+    cumulative_time: float
+    depth: int
+
+
+@dataclass
+class DayStartup:
+    day: int
+    import_time: float = 0.0
+    cold_start: float = 0.0
+    imports: list[ImportRecord] = field(default_factory=list)
+
+
+def get_environment() -> dict[str, str]:
+    """
+    get_environment build the environment of the measured interpreters,
+    with the source folder on the import path
+
+    Returns:
+        dict[str, str]: the environment variables
+    """
+    python_path = os.environ.get("PYTHONPATH")
+    return {
+        **os.environ,
+        "PYTHONPATH": f"{SOURCE_DIR}:{python_path}" if python_path else SOURCE_DIR,
+    }
+
+
+def parse_importtime(report: str) -> list[ImportRecord]:
+    """
+    parse_importtime parse the report written to stderr by python -X importtime
+
+    Args:
+        report (str): the stderr of the interpreter
+
+    Returns:
+        list[ImportRecord]: the imported modules, in import order, times in seconds
+    """
+    records = []
+    for line in report.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, cumulative_time, name = line.removeprefix("import time:").split("|")
+        module = name.lstrip()
+        records.append(
+            ImportRecord(
+                module=module,
+                self_time=int(self_time) / 1e6,
+                cumulative_time=int(cumulative_time) / 1e6,
+                depth=(len(name) - len(module) - 1) // 2,
+            )
+        )
+    return records
+
+
+def measure_imports(day: int) -> list[ImportRecord]:
+    """
+    measure_imports import the solution module of a day in a fresh interpreter
+    with -X importtime
+
+    Args:
+        day (int): the day number
+
+    Returns:
+        list[ImportRecord]: the modules imported by the solution module
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import solutions.day{day}"],
+        env=get_environment(),
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def measure_cold_start(day: int, repeat: int) -> float:
+    """
+    measure_cold_start time the fastest of several runs of a day script,
+    from the start of the interpreter to its exit
+
+    Args:
+        day (int): the day number
+        repeat (int): how many times to run the script
+
+    Returns:
+        float: the fastest wall time in seconds
+    """
+    script = os.path.join(SOLUTIONS_DIR, f"day{day}.py")
+    best = float("inf")
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        subprocess.run(
+            [sys.executable, script],
+            env=get_environment(),
+            stdout=subprocess.DEVNULL,
+            check=True,
+        )
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def measure_startup(day: int, repeat: int) -> DayStartup:
+    """
+    measure_startup measure the import time and the cold start of a day
+
+    Args:
+        day (int): the day number
+        repeat (int): how many times to run the script
+
+    Returns:
+        DayStartup: the startup measures of the day
+    """
+    imports = measure_imports(day)
+    import_time = next(
+        (
+            record.cumulative_time
+            for record in imports
+            if record.module == f"solutions.day{day}"
+        ),
+        0.0,
+    )
+    return DayStartup(
+        day=day,
+        import_time=import_time,
+        cold_start=measure_cold_start(day, repeat),
+        imports=imports,
+    )
+
+
+def format_startup(startup: DayStartup, top: int) -> str:
+    """
+    format_startup format the startup measures of a day with its slowest imports
+
+    Args:
+        startup (DayStartup): the startup measures of the day
+        top (int): how many of the slowest imports to list
+
+    Returns:
+        str: the report of the day
+    """
+    lines = [
+        f"day {startup.day:>2}  import {startup.import_time * 1000:7.1f}ms"
+        f"  cold start {startup.cold_start * 1000:7.1f}ms"
+    ]
+    slowest = sorted(startup.imports, key=lambda record: -record.self_time)[:top]
+    lines += [
+        f"    {record.self_time * 1000:6.1f}ms  {record.module}" for record in slowest
+    ]
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="benchmarks.importtime",
+        description="Report the import time and the cold start of the day scripts.",
+    )
+    parser.add_argument(
+        "days", nargs="*", help="days or ranges to run (ex: 1 3 8-11), default all"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="runs per day, the fastest is kept"
+    )
+    parser.add_argument(
+        "--top", type=int, default=5, help="slowest imports listed per day, default 5"
+    )
+    args = parser.parse_args()
+
+    try:
+        days = parse_day_filter(args.days, discover_days())
+    except ValueError as error:
+        parser.error(str(error))
+
+    startups = []
+    for day in days:
+        startup = measure_startup(day, args.repeat)
+        print(format_startup(startup, args.top), flush=True)
+        startups.append(startup)
+
+    if startups:
+        mean_import = sum(startup.import_time for startup in startups) / len(startups)
+        mean_start = sum(startup.cold_start for startup in startups) / len(startups)
+        print(
+            f"mean import {mean_import * 1000:.1f}ms"
+            f"  mean cold start {mean_start * 1000:.1f}ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
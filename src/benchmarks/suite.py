@@ -0,0 +1,166 @@
+import io
+import math
+import time
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+
+from benchmarks.generators import generate_text
+from runner.registry import get_input_filename, get_solve_function, load_day_module
+from utils.inputs import read_inputs
+
+
+@dataclass
+class BenchmarkRun:
+    factor: int
+    input_size: int
+    seconds: float
+
+
+@dataclass
+class DayBenchmark:
+    day: int
+    runs: list[BenchmarkRun] = field(default_factory=list)
+    exponent: float | None = None
+    skipped: list[int] = field(default_factory=list)
+    error: str | None = None
+
+
+def fit_exponent(runs: list[BenchmarkRun]) -> float | None:
+    """
+    fit_exponent fit the empirical complexity exponent k of time ~ size^k
+    with a least squares regression on the log-log points
+
+    Args:
+        runs (list[BenchmarkRun]): the runs at different input sizes
+
+    Returns:
+        float | None: the exponent, or None with fewer than two distinct sizes
+    """
+    points = [
+        (math.log(run.input_size), math.log(run.seconds))
+        for run in runs
+        if run.input_size > 0 and run.seconds > 0
+    ]
+    if len({x for x, _ in points}) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in points)
+    variance = sum((x - mean_x) ** 2 for x, _ in points)
+    return covariance / variance
+
+
+def time_solution(solve, raw_input: str, repeat: int) -> float:
+    """
+    time_solution time the best of several runs of a solution
+
+    Args:
+        solve: the solution of the day
+        raw_input (str): the input to solve
+        repeat (int): how many times to run the solution
+
+    Returns:
+        float: the fastest run in seconds
+    """
+    timings = []
+    for _ in range(repeat):
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            solve(raw_input)
+            timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def benchmark_day(
+    day: int,
+    factors: list[int],
+    repeat: int = 3,
+    budget: float = 10.0,
+    seed: int = 0,
+) -> DayBenchmark:
+    """
+    benchmark_day run a day's solution on generated inputs as large as
+    its own input times each factor
+
+    Larger factors are skipped once a run is predicted to exceed the budget,
+    extrapolating with the exponent fitted so far (at least linear).
+
+    Args:
+        day (int): the day number
+        factors (list[int]): the factors to scale the input by (ex: [1, 10, 100])
+        repeat (int): how many times to run each size, the fastest run is kept
+        budget (float): the time budget in seconds for a single run
+        seed (int): the seed of the input generator
+
+    Returns:
+        DayBenchmark: the runs, the fitted exponent and the skipped factors
+    """
+    benchmark = DayBenchmark(day)
+    solve = get_solve_function(load_day_module(day))
+    input_size = len(read_inputs(get_input_filename(day)))
+    for factor in sorted(factors):
+        if benchmark.error:
+            benchmark.skipped.append(factor)
+            continue
+        if benchmark.runs:
+            last_run = benchmark.runs[-1]
+            exponent = max(1.0, fit_exponent(benchmark.runs) or 1.0)
+            predicted = last_run.seconds * (factor / last_run.factor) ** exponent
+            if predicted > budget:
+                benchmark.skipped.append(factor)
+                continue
+        scaled_input = generate_text(day, input_size * factor, seed)
+        try:
+            seconds = time_solution(solve, scaled_input, repeat)
+        except Exception as error:
+            benchmark.error = f"x{factor}: {error!r}"
+            benchmark.skipped.append(factor)
+            continue
+        benchmark.runs.append(BenchmarkRun(factor, len(scaled_input), seconds))
+    benchmark.exponent = fit_exponent(benchmark.runs)
+    return benchmark
+
+
+def find_regressions(
+    benchmarks: list[DayBenchmark],
+    baseline: dict,
+    threshold: float,
+    min_seconds: float = 0.001,
+) -> list[str]:
+    """
+    find_regressions compare the benchmarks to a stored baseline
+
+    Args:
+        benchmarks (list[DayBenchmark]): the current benchmarks
+        baseline (dict): the stored baseline, as written by the benchmark suite
+        threshold (float): how many percent slower a run may be
+        min_seconds (float): runs faster than this in the baseline are too noisy
+        to compare
+
+    Returns:
+        list[str]: a description of every run slower than the threshold allows,
+        of every day that failed and of every baseline run that was skipped
+    """
+    regressions = []
+    for benchmark in benchmarks:
+        if benchmark.error:
+            regressions.append(f"day {benchmark.day} failed: {benchmark.error}")
+        baseline_day = baseline.get("days", {}).get(str(benchmark.day), {})
+        baseline_runs = {run["factor"]: run for run in baseline_day.get("runs", [])}
+        regressions += [
+            f"day {benchmark.day} x{factor}: skipped, the baseline ran it in "
+            f"{baseline_runs[factor]['seconds']:.4f}s"
+            for factor in benchmark.skipped
+            if factor in baseline_runs
+        ]
+        for run in benchmark.runs:
+            baseline_run = baseline_runs.get(run.factor)
+            if not baseline_run or baseline_run["seconds"] < min_seconds:
+                continue
+            slowdown = (run.seconds / baseline_run["seconds"] - 1) * 100
+            if slowdown > threshold:
+                regressions.append(
+                    f"day {benchmark.day} x{run.factor}: {run.seconds:.4f}s is "
+                    f"{slowdown:.0f}% slower than {baseline_run['seconds']:.4f}s"
+                )
+    return regressions
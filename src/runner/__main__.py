@@ -0,0 +1,115 @@
+import argparse
+import os
+import time
+
+from runner.parallel import run_days
+from runner.records import RECORD_FORMATS, record_results
+from runner.registry import discover_days, parse_day_filter
+from runner.solve import DayResult
+from utils.func import enable_tracing, format_bytes, format_trace_report
+from utils.parallel import get_available_cores
+
+
+def format_result(
+    result: DayResult, verbose: bool, memory_cap: float | None = None
+) -> str:
+    """
+    format_result format the result of a day as a report row
+
+    Args:
+        result (DayResult): the result of the day
+        verbose (bool): whether to include the output printed by the solution
+        memory_cap (float | None): the memory cap in MiB to flag the day against
+
+    Returns:
+        str: the report row
+    """
+    if result.error:
+        return f"day {result.day:>2}  FAILED\n{result.error}"
+    row = (
+        f"day {result.day:>2}  wall {result.wall_time:8.3f}s  "
+        f"cpu {result.cpu_time:8.3f}s  "
+    )
+    if result.peak_memory is not None and result.net_allocated is not None:
+        row += (
+            f"peak {format_bytes(result.peak_memory):>9}  "
+            f"net {format_bytes(result.net_allocated):>9}  "
+        )
+        if memory_cap and result.peak_memory > memory_cap * 1024 * 1024:
+            row += "OVER CAP  "
+    row += f"answer {result.answer!r}"
+    if verbose and result.output:
+        return row + "\n" + result.output.rstrip()
+    return row
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="runner", description="Solve the Advent of Code days in parallel."
+    )
+    parser.add_argument(
+        "days", nargs="*", help="days or ranges to run (ex: 1 3 8-11), default all"
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=get_available_cores(),
+        help="number of worker processes, default the available cores",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="show the solutions' output"
+    )
+    parser.add_argument(
+        "--trace", action="store_true", help="show the time spent in each stage"
+    )
+    parser.add_argument(
+        "--memory",
+        action="store_true",
+        help="trace the peak memory and net allocations of each day and stage",
+    )
+    parser.add_argument(
+        "--memory-cap",
+        type=float,
+        metavar="MIB",
+        help="flag the days whose peak memory exceeds this cap (implies --memory)",
+    )
+    parser.add_argument(
+        "--records",
+        default=os.environ.get("AOC_RECORDS"),
+        metavar="PATH",
+        help="write a performance record per part to this file, default $AOC_RECORDS",
+    )
+    parser.add_argument(
+        "--records-format",
+        choices=RECORD_FORMATS,
+        help="format of the records, default prometheus for .prom files else jsonl",
+    )
+    args = parser.parse_args()
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+    args.memory = args.memory or args.memory_cap is not None
+    args.trace = args.trace or args.memory
+    if args.trace:
+        enable_tracing(memory=args.memory)
+
+    try:
+        days = parse_day_filter(args.days, discover_days())
+    except ValueError as error:
+        parser.error(str(error))
+    start = time.perf_counter()
+    results = sorted(run_days(days, args.workers), key=lambda result: result.day)
+    for result in results:
+        print(format_result(result, args.verbose, args.memory_cap))
+    print(f"Solved {len(days)} days in {time.perf_counter() - start:.3f}s")
+    if args.records:
+        record_results(results, args.records, args.records_format)
+    if args.trace:
+        for result in results:
+            if result.trace:
+                print(format_trace_report(result.trace))
+    return 1 if any(result.error for result in results) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,255 @@
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Iterator, TextIO
+
+from toolz import partition_all
+
+from runner.registry import discover_days, load_day_module
+from runner.solve import solve_day
+from utils.parallel import get_available_cores
+
+TChunk = tuple[tuple[int, str], ...]
+
+
+def find_inputs(source: str) -> list[str]:
+    """
+    find_inputs list the input files of a batch
+
+    Args:
+        source (str): a directory (every file in it) or a glob pattern
+
+    Returns:
+        list[str]: the sorted paths of the input files
+    """
+    if os.path.isdir(source):
+        paths = (os.path.join(source, name) for name in os.listdir(source))
+    else:
+        paths = glob.glob(source, recursive=True)
+    return sorted(path for path in paths if os.path.isfile(path))
+
+
+def make_record(
+    day: int, path: str, answer: Any = None, error: str | None = None, **measures
+) -> dict[str, Any]:
+    return {
+        "input": path,
+        "day": day,
+        "answer": answer,
+        "input_hash": measures.get("input_hash"),
+        "input_size": measures.get("input_size", 0),
+        "wall_time": measures.get("wall_time", 0.0),
+        "cpu_time": measures.get("cpu_time", 0.0),
+        "peak_rss": measures.get("peak_rss"),
+        "error": error,
+    }
+
+
+def solve_input(day: int, path: str) -> dict[str, Any]:
+    """
+    solve_input solve one input file of a batch
+
+    Args:
+        day (int): the day number
+        path (str): the path of the input file
+
+    Returns:
+        dict[str, Any]: the JSON record with the answer and the timings,
+        or the error if the file could not be read or the solution failed
+    """
+    try:
+        with open(path) as f:
+            raw_input = f.read().strip()
+    except (OSError, UnicodeDecodeError) as error:
+        return make_record(day, path, error=f"{type(error).__name__}: {error}")
+    result = solve_day(day, raw_input)
+    return make_record(
+        day,
+        path,
+        answer=result.answer,
+        error=result.error,
+        input_hash=result.input_hash,
+        input_size=result.input_size,
+        wall_time=result.wall_time,
+        cpu_time=result.cpu_time,
+        peak_rss=result.peak_rss,
+    )
+
+
+def solve_chunk(day: int, chunk: TChunk) -> list[tuple[int, dict[str, Any]]]:
+    """
+    solve_chunk solve a chunk of input files in a worker process
+
+    Args:
+        day (int): the day number
+        chunk (TChunk): the index in the batch and the path of each input
+
+    Returns:
+        list[tuple[int, dict[str, Any]]]: the index and the record of each input
+    """
+    return [(index, solve_input(day, path)) for index, path in chunk]
+
+
+def get_chunk_size(inputs: int, workers: int) -> int:
+    """
+    get_chunk_size pick the number of inputs sent to a worker at once,
+    about four chunks per worker like multiprocessing's Pool.map
+
+    Args:
+        inputs (int): the number of inputs
+        workers (int): the number of worker processes
+
+    Returns:
+        int: the chunk size
+    """
+    chunk_size, extra = divmod(inputs, workers * 4)
+    return max(chunk_size + bool(extra), 1)
+
+
+def run_chunks(
+    day: int, chunks: list[TChunk], workers: int
+) -> Iterator[tuple[TChunk, list[tuple[int, dict[str, Any]]] | None]]:
+    """
+    run_chunks solve the chunks in a pool of worker processes
+
+    Args:
+        day (int): the day number
+        chunks (list[TChunk]): the chunks to solve
+        workers (int): the size of the pool
+
+    Returns:
+        Iterator: each chunk with its records, in the order the chunks finish,
+        or with None if the pool broke before the chunk was solved
+    """
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as executor:
+        futures = {executor.submit(solve_chunk, day, chunk): chunk for chunk in chunks}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()
+            except BrokenProcessPool:
+                yield futures[future], None
+
+
+def run_batch(
+    day: int,
+    paths: list[str],
+    workers: int | None = None,
+    chunk_size: int | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    run_batch solve many inputs of a day in a pool of worker processes
+
+    A worker dying (segfault, out of memory killer, os._exit) breaks the whole pool,
+    so the chunks that were not solved are retried one input per chunk in a new pool,
+    and an input that breaks the pool again is run alone to find out if it is the
+    one crashing the worker.
+
+    Args:
+        day (int): the day number
+        paths (list[str]): the input files
+        workers (int | None): the size of the pool, defaults to the available cores
+        chunk_size (int | None): the inputs sent to a worker at once
+
+    Returns:
+        Iterator[dict[str, Any]]: the records, in the order of the paths
+    """
+    load_day_module(day)
+    workers = workers or get_available_cores()
+    chunk_size = chunk_size or get_chunk_size(len(paths), workers)
+    chunks = list(partition_all(chunk_size, enumerate(paths)))
+
+    records: dict[int, dict[str, Any]] = {}
+    next_index = 0
+    alone: list[TChunk] = []
+    while chunks or alone:
+        batch = chunks or [alone.pop(0)]
+        chunks = []
+        for chunk, chunk_records in run_chunks(day, batch, workers):
+            if chunk_records is not None:
+                records.update(chunk_records)
+            elif len(chunk) > 1:
+                chunks.extend((item,) for item in chunk)
+            elif len(batch) > 1:
+                alone.append(chunk)
+            else:
+                (index, path), *_ = chunk
+                records[index] = make_record(
+                    day, path, error="BrokenProcessPool: the worker process crashed"
+                )
+            while next_index in records:
+                yield records.pop(next_index)
+                next_index += 1
+
+
+def write_records(records: Iterator[dict[str, Any]], output: TextIO) -> tuple[int, int]:
+    """
+    write_records write the records as JSON lines
+
+    Args:
+        records (Iterator[dict[str, Any]]): the records to write
+        output (TextIO): the file to write to
+
+    Returns:
+        tuple[int, int]: the number of records written and how many had an error
+    """
+    written, failed = 0, 0
+    for record in records:
+        output.write(json.dumps(record, default=repr) + "\n")
+        output.flush()
+        written += 1
+        failed += record["error"] is not None
+    return written, failed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="runner.batch",
+        description="Solve many inputs of a day and write the answers as JSON lines.",
+    )
+    parser.add_argument("day", type=int, help="the day to solve")
+    parser.add_argument(
+        "source", help="a directory of inputs or a glob (ex: 'inputs/day8/*.txt')"
+    )
+    parser.add_argument(
+        "-j", "--workers", type=int, help="worker processes, default the cores"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, help="inputs sent to a worker at once"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="the JSON lines file or '-', default '-'"
+    )
+    args = parser.parse_args()
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers must be at least 1")
+    if args.chunk_size is not None and args.chunk_size < 1:
+        parser.error("--chunk-size must be at least 1")
+
+    if args.day not in discover_days():
+        parser.error(f"Unknown day {args.day}")
+    paths = find_inputs(args.source)
+    if not paths:
+        parser.error(f"No input found in {args.source}")
+
+    start = time.perf_counter()
+    records = run_batch(args.day, paths, args.workers, args.chunk_size)
+    if args.output == "-":
+        written, failed = write_records(records, sys.stdout)
+    else:
+        with open(args.output, "w") as f:
+            written, failed = write_records(records, f)
+    print(
+        f"Solved {written - failed}/{written} inputs of day {args.day}"
+        f" in {time.perf_counter() - start:.3f}s",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,67 @@
+import argparse
+import os
+import sys
+
+from runner.protocol import (
+    DEFAULT_SOCKET_PATH,
+    connect,
+    parse_address,
+    receive_message,
+    send_message,
+)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="runner.client", description="Ask the solver daemon to solve a day."
+    )
+    parser.add_argument("day", nargs="?", type=int, help="the day to solve")
+    parser.add_argument(
+        "input",
+        nargs="?",
+        help="path of the input file or '-' to read it from stdin, "
+        "default the day's input file",
+    )
+    parser.add_argument(
+        "--address",
+        default=DEFAULT_SOCKET_PATH,
+        help=f"unix socket path or HOST:PORT, default {DEFAULT_SOCKET_PATH}",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="show the solution's output"
+    )
+    parser.add_argument("--stop", action="store_true", help="stop the daemon")
+    args = parser.parse_args()
+
+    if args.stop:
+        request = {"command": "shutdown"}
+    elif args.day is None:
+        parser.error("the day is required")
+    elif args.input == "-":
+        request = {"day": args.day, "input": sys.stdin.read()}
+    elif args.input:
+        request = {"day": args.day, "path": os.path.abspath(args.input)}
+    else:
+        request = {"day": args.day}
+
+    with connect(parse_address(args.address)) as connection:
+        send_message(connection, request)
+        response = receive_message(connection) or {"error": "No response"}
+
+    if response.get("error"):
+        print(response["error"], file=sys.stderr)
+        return 1
+    if args.stop:
+        print("Solver daemon stopped")
+        return 0
+    if args.verbose and response["output"]:
+        print(response["output"].rstrip())
+    print(
+        f"day {response['day']:>2}  wall {response['wall_time']:8.3f}s  "
+        f"cpu {response['cpu_time']:8.3f}s  answer {response['answer']!r}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
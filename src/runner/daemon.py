@@ -0,0 +1,178 @@
+import argparse
+import os
+import socketserver
+import threading
+from dataclasses import asdict
+from typing import Any
+
+from runner.protocol import (
+    DEFAULT_SOCKET_PATH,
+    is_loopback_host,
+    parse_address,
+    receive_message,
+    send_message,
+)
+from runner.records import RECORD_FORMATS, record_results
+from runner.registry import discover_days, load_day_module
+from runner.solve import solve_day
+from utils.inputs import read_inputs
+
+
+def handle_request(
+    request: dict[str, Any],
+    records_path: str | None = None,
+    records_format: str | None = None,
+) -> dict[str, Any]:
+    """
+    handle_request solve the day described by a request
+
+    Args:
+        request (dict[str, Any]): the request, with the day and optionally
+        the raw input text ("input") or the path of an input file ("path")
+        records_path (str | None): the file to write the records of the day to
+        records_format (str | None): the format of the records, see write_records
+
+    Returns:
+        dict[str, Any]: the result of the day
+    """
+    day = int(request["day"])
+    if day not in discover_days():
+        return {"day": day, "error": f"No solution for day {day}"}
+    if "input" in request:
+        raw_input = request["input"].strip()
+    elif "path" in request:
+        raw_input = read_inputs(request["path"])
+    else:
+        raw_input = None
+    result = solve_day(day, raw_input)
+    if records_path:
+        record_results([result], records_path, records_format)
+    return asdict(result)
+
+
+class SolverRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        request = receive_message(self.connection)
+        if request is None:
+            return
+        if request.get("command") == "shutdown":
+            send_message(self.connection, {"status": "stopping"})
+            threading.Thread(target=self.server.shutdown).start()
+            return
+        try:
+            response = handle_request(
+                request, self.server.records_path, self.server.records_format
+            )
+        except Exception as error:
+            response = {"day": request.get("day"), "error": repr(error)}
+        send_message(self.connection, response)
+
+
+class SolverServer:
+    records_path: str | None = None
+    records_format: str | None = None
+
+
+class TCPSolverServer(SolverServer, socketserver.TCPServer):
+    allow_reuse_address = True
+
+
+class UnixSolverServer(SolverServer, socketserver.UnixStreamServer):
+    pass
+
+
+def create_server(
+    address: str | tuple[str, int],
+    records_path: str | None = None,
+    records_format: str | None = None,
+    allow_remote: bool = False,
+) -> socketserver.BaseServer:
+    """
+    create_server bind the solver server to a unix socket or a localhost TCP port
+
+    The daemon reads any path it is sent, so a TCP port is only bound on a
+    loopback address unless remote connections are explicitly allowed.
+
+    Args:
+        address (str | tuple[str, int]): the socket path or the (host, port) pair
+        records_path (str | None): the file to write the records of the solved
+        days to, none written when None
+        records_format (str | None): the format of the records, see write_records
+        allow_remote (bool): whether to bind a TCP port on a non-loopback host
+
+    Returns:
+        socketserver.BaseServer: the bound server
+
+    Raises:
+        ValueError: if the TCP host is not a loopback address and remote
+        connections are not allowed
+    """
+    server: TCPSolverServer | UnixSolverServer
+    if isinstance(address, tuple):
+        if not allow_remote and not is_loopback_host(address[0]):
+            raise ValueError(
+                f"{address[0]} is not a loopback address, "
+                "pass --allow-remote to accept remote connections"
+            )
+        server = TCPSolverServer(address, SolverRequestHandler)
+    else:
+        if os.path.exists(address):
+            os.unlink(address)
+        server = UnixSolverServer(address, SolverRequestHandler)
+    server.records_path = records_path
+    server.records_format = records_format
+    return server
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="runner.daemon",
+        description="Keep the solutions imported and solve days on request.",
+    )
+    parser.add_argument(
+        "--address",
+        default=DEFAULT_SOCKET_PATH,
+        help=f"unix socket path or HOST:PORT, default {DEFAULT_SOCKET_PATH}",
+    )
+    parser.add_argument(
+        "--allow-remote",
+        action="store_true",
+        help="allow listening on a TCP address other than loopback",
+    )
+    parser.add_argument(
+        "--records",
+        default=os.environ.get("AOC_RECORDS"),
+        metavar="PATH",
+        help="write a performance record per part solved to this file, "
+        "default $AOC_RECORDS",
+    )
+    parser.add_argument(
+        "--records-format",
+        choices=RECORD_FORMATS,
+        help="format of the records, default prometheus for .prom files else jsonl",
+    )
+    args = parser.parse_args()
+
+    for day in discover_days():
+        load_day_module(day)
+
+    address = parse_address(args.address)
+    try:
+        server = create_server(
+            address, args.records, args.records_format, args.allow_remote
+        )
+    except ValueError as error:
+        parser.error(str(error))
+    with server:
+        print(f"Solver daemon listening on {args.address}")
+        try:
+            server.serve_forever(poll_interval=0.1)
+        except KeyboardInterrupt:
+            pass
+    if isinstance(address, str) and os.path.exists(address):
+        os.unlink(address)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
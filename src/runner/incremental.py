@@ -0,0 +1,105 @@
+import argparse
+import io
+import os
+import time
+from contextlib import redirect_stdout
+
+from runner.registry import (
+    discover_days,
+    get_input_filename,
+    get_solve_function,
+    load_day_module,
+    parse_day_filter,
+)
+from utils.incremental import IncrementalResult, solve_incremental
+from utils.inputs import get_input_path, read_inputs
+
+
+def get_incremental_days() -> list[int]:
+    """
+    get_incremental_days find the days whose solution is also written as a fold
+
+    Returns:
+        list[int]: the sorted list of days with an `incremental` fold
+    """
+    return [
+        day
+        for day in discover_days()
+        if hasattr(load_day_module(day), "incremental")
+    ]
+
+
+def solve_day_incremental(
+    day: int, input_path: str | None = None, reset: bool = False
+) -> IncrementalResult:
+    """
+    solve_day_incremental solve a day by folding in only the bytes appended to
+    its input since the last run
+
+    Args:
+        day (int): the day number
+        input_path (str | None): the input file, defaults to the day's input file
+        reset (bool): whether to fold the whole input again
+
+    Returns:
+        IncrementalResult: the answer and the range of bytes folded
+    """
+    module = load_day_module(day)
+    input_path = input_path or get_input_path(get_input_filename(day))
+    return solve_incremental(module.incremental, module.__name__, input_path, reset)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="runner.incremental",
+        description="Solve growing inputs, folding in only the appended bytes.",
+    )
+    parser.add_argument(
+        "days",
+        nargs="*",
+        help="days or ranges to solve (ex: 1-4), default all with a fold",
+    )
+    parser.add_argument(
+        "-i", "--input", help="the input file of a single day, default its input file"
+    )
+    parser.add_argument(
+        "--reset", action="store_true", help="ignore the saved states"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="also solve the whole input with the reference solution and compare",
+    )
+    args = parser.parse_args()
+
+    try:
+        days = parse_day_filter(args.days, get_incremental_days())
+    except ValueError as error:
+        parser.error(str(error))
+    if args.input and len(days) != 1:
+        parser.error("--input needs a single day")
+    input_path = os.path.abspath(args.input) if args.input else None
+
+    failed = False
+    for day in days:
+        start = time.perf_counter()
+        result = solve_day_incremental(day, input_path, args.reset)
+        elapsed = time.perf_counter() - start
+        mode = "resumed" if result.resumed else "full"
+        row = (
+            f"day {day:>2}  {mode:<7}  folded {result.end - result.start:>10} bytes"
+            f" from {result.start:>10}  in {elapsed:8.3f}s  answer {result.answer!r}"
+        )
+        if args.check:
+            raw_input = read_inputs(input_path or get_input_filename(day))
+            with redirect_stdout(io.StringIO()):
+                expected = get_solve_function(load_day_module(day))(raw_input)
+            if tuple(expected) != tuple(result.answer):
+                row += f"  MISMATCH expected {expected!r}"
+                failed = True
+        print(row)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,27 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Iterator
+
+from runner.registry import load_day_module
+from runner.solve import DayResult, solve_day
+from utils.parallel import get_available_cores
+
+
+def run_days(days: list[int], workers: int | None = None) -> Iterator[DayResult]:
+    """
+    run_days solve the days in a pool of worker processes
+
+    Args:
+        days (list[int]): the days to solve
+        workers (int | None): the size of the pool, defaults to the available cores
+
+    Returns:
+        Iterator[DayResult]: the results in the order the days finish
+    """
+    for day in days:
+        load_day_module(day)
+
+    max_workers = min(workers or get_available_cores(), len(days)) or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(solve_day, day) for day in days]
+        for future in as_completed(futures):
+            yield future.result()
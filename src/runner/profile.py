@@ -0,0 +1,241 @@
+import argparse
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+from collections import Counter
+from contextlib import redirect_stdout
+from types import CodeType
+from typing import Any, Callable
+
+from benchmarks.generators import generate_text
+from runner.registry import (
+    discover_days,
+    get_input_filename,
+    get_solve_function,
+    load_day_module,
+)
+from utils.inputs import read_inputs, set_parse_cache
+
+PROFILES_DIR = os.path.join(os.path.dirname(__file__), "../../.cache/profiles")
+
+
+def get_profile_input(day: int, scale: int | None = None, seed: int = 0) -> str:
+    """
+    get_profile_input get the input to profile a day on
+
+    Args:
+        day (int): the day number
+        scale (int | None): use a generated input this many times larger
+        than the day's input file instead of the input file
+        seed (int): the seed of the input generator
+
+    Returns:
+        str: the input
+    """
+    raw_input = read_inputs(get_input_filename(day))
+    if scale:
+        return generate_text(day, len(raw_input) * scale, seed)
+    return raw_input
+
+
+def profile_day(day: int, raw_input: str) -> pstats.Stats:
+    """
+    profile_day run the solution of a day under cProfile
+
+    The day module is imported and the parse cache disabled beforehand, so the
+    profile only shows the solving (parsing included).
+
+    Args:
+        day (int): the day number
+        raw_input (str): the input to solve
+
+    Returns:
+        pstats.Stats: the statistics of the run
+    """
+    solve = get_solve_function(load_day_module(day))
+    set_parse_cache(False)
+    profiler = cProfile.Profile()
+    with redirect_stdout(io.StringIO()):
+        profiler.runcall(solve, raw_input)
+    return pstats.Stats(profiler)
+
+
+def format_text_report(stats: pstats.Stats, sort: str, limit: int) -> str:
+    """
+    format_text_report format the functions with the most time as a pstats table
+
+    Args:
+        stats (pstats.Stats): the statistics of the run
+        sort (str): the pstats sort key (ex: "cumulative", "tottime")
+        limit (int): the number of functions to list
+
+    Returns:
+        str: the report
+    """
+    report = io.StringIO()
+    stats.stream = report
+    stats.sort_stats(sort).print_stats(limit)
+    return report.getvalue()
+
+
+def get_frame_name(code: CodeType) -> str:
+    """
+    get_frame_name name a function as a frame of a collapsed stack
+
+    Args:
+        code (CodeType): the code of the function
+
+    Returns:
+        str: the name of the function with its file and line, without ";"
+    """
+    filename = os.path.basename(code.co_filename)
+    return f"{code.co_name} ({filename}:{code.co_firstlineno})".replace(";", ",")
+
+
+def sample_stacks(
+    func: Callable[..., Any], *args: Any, interval: float = 0.001
+) -> Counter[str]:
+    """
+    sample_stacks call a function while a thread samples its Python stack
+
+    cProfile only keeps caller to callee edges, not whole stacks, so the stacks of
+    a flamegraph are sampled instead, without the call overhead of cProfile.
+    The interpreter switches threads more often while sampling so the sampler
+    gets to run every interval.
+
+    Args:
+        func (Callable[..., Any]): the function to sample
+        *args (Any): the arguments of the function
+        interval (float): the seconds between two samples
+
+    Returns:
+        Counter[str]: the number of samples of each stack, frames joined with ";"
+    """
+    stacks: Counter[str] = Counter()
+    entry = sys._getframe()
+    thread_id = threading.get_ident()
+    done = threading.Event()
+
+    def sample() -> None:
+        while not done.wait(interval):
+            frame = sys._current_frames().get(thread_id)
+            frames = []
+            while frame is not None and frame is not entry:
+                frames.append(get_frame_name(frame.f_code))
+                frame = frame.f_back
+            if frame is entry and frames:
+                stacks[";".join(reversed(frames))] += 1
+
+    switch_interval = sys.getswitchinterval()
+    sampler = threading.Thread(target=sample, daemon=True)
+    sys.setswitchinterval(interval)
+    sampler.start()
+    try:
+        func(*args)
+    finally:
+        done.set()
+        sampler.join()
+        sys.setswitchinterval(switch_interval)
+    return stacks
+
+
+def sample_day(day: int, raw_input: str, interval: float = 0.001) -> Counter[str]:
+    """
+    sample_day sample the stacks of the solution of a day
+
+    Args:
+        day (int): the day number
+        raw_input (str): the input to solve
+        interval (float): the seconds between two samples
+
+    Returns:
+        Counter[str]: the number of samples of each stack
+    """
+    solve = get_solve_function(load_day_module(day))
+    set_parse_cache(False)
+    with redirect_stdout(io.StringIO()):
+        return sample_stacks(solve, raw_input, interval=interval)
+
+
+def write_collapsed_stacks(stacks: Counter[str], path: str) -> None:
+    """
+    write_collapsed_stacks write the sampled stacks with their number of samples,
+    the input of flamegraph.pl, speedscope or inferno
+
+    Args:
+        stacks (Counter[str]): the number of samples of each stack
+        path (str): the file to write
+    """
+    with open(path, "w") as f:
+        for stack, samples in sorted(stacks.items()):
+            f.write(f"{stack} {samples}\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="runner.profile",
+        description="Profile a day and write a text report and a flamegraph input.",
+    )
+    parser.add_argument("day", type=int, help="the day to profile")
+    parser.add_argument(
+        "--scale",
+        type=int,
+        help="profile on a generated input this many times larger than the input",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=0, help="seed of the input generator, default 0"
+    )
+    parser.add_argument(
+        "--sort",
+        default="cumulative",
+        choices=["cumulative", "tottime", "calls", "ncalls"],
+        help="how to sort the text report, default cumulative",
+    )
+    parser.add_argument(
+        "--limit", type=int, default=30, help="functions in the text report"
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=1.0,
+        help="milliseconds between two stack samples, default 1",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=PROFILES_DIR,
+        help="the folder of the reports, default .cache/profiles",
+    )
+    args = parser.parse_args()
+
+    if args.day not in discover_days():
+        parser.error(f"Unknown day {args.day}")
+
+    raw_input = get_profile_input(args.day, args.scale, args.seed)
+    stats = profile_day(args.day, raw_input)
+    stacks = sample_day(args.day, raw_input, args.interval / 1000)
+    os.makedirs(args.output, exist_ok=True)
+    name = f"day{args.day}" + (f"-x{args.scale}" if args.scale else "")
+    paths = {
+        extension: os.path.join(args.output, f"{name}.{extension}")
+        for extension in ("txt", "folded", "pstats")
+    }
+    report = format_text_report(stats, args.sort, args.limit)
+    with open(paths["txt"], "w") as f:
+        f.write(report)
+    write_collapsed_stacks(stacks, paths["folded"])
+    stats.dump_stats(paths["pstats"])
+
+    print(report)
+    print(f"Sampled {sum(stacks.values())} stacks every {args.interval}ms")
+    for path in paths.values():
+        print(f"Wrote {os.path.normpath(path)}")
+    print(f"Render the flamegraph with: flamegraph.pl {paths['folded']} > {name}.svg")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+import ipaddress
+import json
+import os
+import socket
+from typing import Any
+
+DEFAULT_SOCKET_PATH = os.path.join(
+    os.environ.get("XDG_RUNTIME_DIR") or os.environ.get("TMPDIR") or "/tmp",
+    "aoc-solver.sock",
+)
+
+
+def parse_address(address: str) -> str | tuple[str, int]:
+    """
+    parse_address parse the address the solver daemon listens on
+
+    Args:
+        address (str): a unix socket path or a HOST:PORT TCP address
+        (ex: "127.0.0.1:7777", the host defaults to 127.0.0.1)
+
+    Returns:
+        str | tuple[str, int]: the socket path or the (host, port) pair
+    """
+    host, separator, port = address.rpartition(":")
+    if separator and port.isdigit():
+        return host or "127.0.0.1", int(port)
+    return address
+
+
+def is_loopback_host(host: str) -> bool:
+    """
+    is_loopback_host check that a host only resolves to loopback addresses
+
+    Args:
+        host (str): an IP address or a host name
+
+    Returns:
+        bool: whether every address of the host is a loopback address,
+        False if it cannot be resolved
+    """
+    try:
+        addresses = {info[4][0] for info in socket.getaddrinfo(host, None)}
+    except socket.gaierror:
+        return False
+    return bool(addresses) and all(
+        ipaddress.ip_address(address.split("%")[0]).is_loopback
+        for address in addresses
+    )
+
+
+def connect(address: str | tuple[str, int]) -> socket.socket:
+    """
+    connect open a connection to the solver daemon
+
+    Args:
+        address (str | tuple[str, int]): the socket path or the (host, port) pair
+
+    Returns:
+        socket.socket: the connected socket
+    """
+    if isinstance(address, tuple):
+        return socket.create_connection(address)
+    connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    connection.connect(address)
+    return connection
+
+
+def send_message(connection: socket.socket, message: dict[str, Any]) -> None:
+    """
+    send_message send a message as a single line of JSON
+
+    Args:
+        connection (socket.socket): the connected socket
+        message (dict[str, Any]): the message to send
+    """
+    connection.sendall(json.dumps(message).encode() + b"\n")
+
+
+def receive_message(connection: socket.socket) -> dict[str, Any] | None:
+    """
+    receive_message read a single line of JSON from the connection
+
+    Args:
+        connection (socket.socket): the connected socket
+
+    Returns:
+        dict[str, Any] | None: the message or None if the connection was closed
+    """
+    chunks = []
+    while not chunks or not chunks[-1].endswith(b"\n"):
+        chunk = connection.recv(65536)
+        if not chunk:
+            break
+        chunks.append(chunk)
+    data = b"".join(chunks)
+    return json.loads(data) if data.strip() else None
@@ -0,0 +1,252 @@
+import json
+import os
+import re
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Iterable
+
+from runner.solve import DayResult, measure_solve
+
+RECORD_FORMATS = ("jsonl", "prometheus")
+# The gauges of a record: (metric name, description, field of RunRecord)
+PROMETHEUS_METRICS = (
+    ("aoc_solve_wall_seconds", "Wall-clock time of the solve", "wall_time"),
+    ("aoc_solve_cpu_seconds", "CPU time of the solve", "cpu_time"),
+    ("aoc_solve_peak_rss_bytes", "Peak RSS during the solve", "peak_rss"),
+    ("aoc_input_size_bytes", "Size of the input", "input_size"),
+    ("aoc_solve_timestamp_seconds", "Unix time of the solve", "timestamp"),
+)
+PROMETHEUS_SAMPLE_PATTERN = re.compile(r'^(\w+)\{day="(\d+)",part="(\d+)"')
+
+
+@dataclass
+class RunRecord:
+    day: int
+    part: int
+    answer: Any
+    input_hash: str | None
+    input_size: int
+    wall_time: float
+    cpu_time: float
+    peak_rss: int | None
+    timestamp: float
+
+
+def make_records(result: DayResult, timestamp: float | None = None) -> list[RunRecord]:
+    """
+    make_records make a record for each part answered by a solved day
+
+    Both parts are solved by a single call, so the records of a day share
+    the timings of the whole solve.
+
+    Args:
+        result (DayResult): the result of the day
+        timestamp (float | None): the time of the run, defaults to now
+
+    Returns:
+        list[RunRecord]: a record per part, none if the day failed
+    """
+    if result.error:
+        return []
+    answers = result.answer if isinstance(result.answer, tuple) else (result.answer,)
+    timestamp = time.time() if timestamp is None else timestamp
+    return [
+        RunRecord(
+            day=result.day,
+            part=part,
+            answer=answer,
+            input_hash=result.input_hash,
+            input_size=result.input_size,
+            wall_time=result.wall_time,
+            cpu_time=result.cpu_time,
+            peak_rss=result.peak_rss,
+            timestamp=timestamp,
+        )
+        for part, answer in enumerate(answers, start=1)
+    ]
+
+
+def write_jsonl_records(records: Iterable[RunRecord], path: str) -> None:
+    """
+    write_jsonl_records append the records to a JSON lines file
+
+    Args:
+        records (Iterable[RunRecord]): the records to write
+        path (str): the JSON lines file
+    """
+    with open(path, "a") as f:
+        for record in records:
+            f.write(json.dumps(asdict(record), default=repr) + "\n")
+
+
+def escape_label(value: Any) -> str:
+    """
+    escape_label escape a value for a Prometheus label
+
+    Args:
+        value (Any): the value of the label
+
+    Returns:
+        str: the value with backslashes, double quotes and line breaks escaped
+    """
+    return (
+        str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    )
+
+
+def format_prometheus_samples(record: RunRecord) -> dict[tuple[str, int, int], str]:
+    """
+    format_prometheus_samples format the samples of a record in the Prometheus
+    text format
+
+    Args:
+        record (RunRecord): the record to format
+
+    Returns:
+        dict[tuple[str, int, int], str]: the sample line of each gauge of the record,
+        keyed by (metric, day, part)
+    """
+    labels = f'day="{record.day}",part="{record.part}"'
+    samples = {
+        (name, record.day, record.part): f"{name}{{{labels}}} {getattr(record, field)}"
+        for name, _, field in PROMETHEUS_METRICS
+        if getattr(record, field) is not None
+    }
+    samples["aoc_answer_info", record.day, record.part] = (
+        f"aoc_answer_info{{{labels},"
+        f'answer="{escape_label(record.answer)}",'
+        f'input_hash="{escape_label(record.input_hash)}"}} 1'
+    )
+    return samples
+
+
+def read_prometheus_samples(path: str) -> dict[tuple[str, int, int], str]:
+    """
+    read_prometheus_samples read the samples of a Prometheus textfile written by
+    write_prometheus_records
+
+    Args:
+        path (str): the .prom file
+
+    Returns:
+        dict[tuple[str, int, int], str]: the sample lines keyed by (metric, day,
+        part), empty when the file does not exist
+    """
+    try:
+        with open(path) as f:
+            lines = f.read().splitlines()
+    except FileNotFoundError:
+        return {}
+    samples = {}
+    for line in lines:
+        match = PROMETHEUS_SAMPLE_PATTERN.match(line)
+        if match:
+            name, day, part = match.groups()
+            samples[name, int(day), int(part)] = line
+    return samples
+
+
+def format_prometheus_records(
+    records: Iterable[RunRecord],
+    previous_samples: dict[tuple[str, int, int], str] | None = None,
+) -> str:
+    """
+    format_prometheus_records format the records in the Prometheus text format
+
+    Args:
+        records (Iterable[RunRecord]): the records to format
+        previous_samples (dict[tuple[str, int, int], str] | None): the samples
+        already recorded (see read_prometheus_samples), kept for the parts that
+        are not in the records
+
+    Returns:
+        str: the gauges of the records, the answer and the input hash as labels
+        of an info gauge
+    """
+    samples = dict(previous_samples or {})
+    for record in records:
+        samples.update(format_prometheus_samples(record))
+    metrics = [(name, description) for name, description, _ in PROMETHEUS_METRICS]
+    metrics.append(("aoc_answer_info", "Answer of the part and hash of its input"))
+    lines = []
+    for name, description in metrics:
+        lines += [f"# HELP {name} {description}.", f"# TYPE {name} gauge"]
+        lines += [line for key, line in sorted(samples.items()) if key[0] == name]
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_records(records: Iterable[RunRecord], path: str) -> None:
+    """
+    write_prometheus_records write the records to a Prometheus textfile collector
+    file, replacing it atomically so the collector never reads a partial file
+
+    The samples of the parts already in the file and not in the records are
+    kept, so recording the days one at a time (a daemon request or a day script
+    each) accumulates them instead of leaving only the last one.
+
+    Args:
+        records (Iterable[RunRecord]): the records to write
+        path (str): the .prom file
+    """
+    previous_samples = read_prometheus_samples(path)
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with open(temporary_path, "w") as f:
+        f.write(format_prometheus_records(records, previous_samples))
+    os.replace(temporary_path, path)
+
+
+def write_records(records: Iterable[RunRecord], path: str, format: str | None) -> None:
+    """
+    write_records write the records as JSON lines or as a Prometheus textfile
+
+    Args:
+        records (Iterable[RunRecord]): the records to write
+        path (str): the file to write
+        format (str | None): "jsonl" or "prometheus", guessed from the extension
+        of the file when None (.prom is Prometheus)
+    """
+    if format is None:
+        format = "prometheus" if path.endswith(".prom") else "jsonl"
+    if format == "prometheus":
+        write_prometheus_records(records, path)
+    else:
+        write_jsonl_records(records, path)
+
+
+def record_results(
+    results: Iterable[DayResult], path: str, format: str | None = None
+) -> None:
+    """
+    record_results write the records of the parts answered by the solved days
+
+    Args:
+        results (Iterable[DayResult]): the results of the days
+        path (str): the file to write
+        format (str | None): "jsonl" or "prometheus", see write_records
+    """
+    timestamp = time.time()
+    records = [
+        record for result in results for record in make_records(result, timestamp)
+    ]
+    write_records(records, path, format)
+
+
+def record_day_run(day: int, solve: Callable, raw_input: str) -> Any:
+    """
+    record_day_run solve the input of a day script, measured, and write its
+    records to $AOC_RECORDS when it is set, so a day script run directly is
+    recorded like the runner's
+
+    Args:
+        day (int): the day number
+        solve (Callable): the function solving both parts from the raw input
+        raw_input (str): the input to solve
+
+    Returns:
+        Any: the answer of the solution
+    """
+    result = measure_solve(day, solve, raw_input)
+    path = os.environ.get("AOC_RECORDS")
+    if path:
+        record_results([result], path)
+    return result.answer
@@ -0,0 +1,102 @@
+import importlib
+import os
+import re
+from types import ModuleType
+from typing import Any, Callable
+
+SOLUTIONS_DIR = os.path.join(os.path.dirname(__file__), "../solutions")
+DAY_MODULE_PATTERN = re.compile(r"^day(\d+)\.py$")
+
+TSolve = Callable[[str], Any]
+
+
+def discover_days() -> list[int]:
+    """
+    discover_days find the days that have a solution module
+
+    Returns:
+        list[int]: the sorted list of day numbers found in the solutions folder
+    """
+    matches = (DAY_MODULE_PATTERN.match(name) for name in os.listdir(SOLUTIONS_DIR))
+    return sorted(int(match.group(1)) for match in matches if match)
+
+
+def load_day_module(day: int) -> ModuleType:
+    """
+    load_day_module import the solution module of a day
+
+    Args:
+        day (int): the day number
+
+    Returns:
+        ModuleType: the imported solutions.dayN module
+    """
+    return importlib.import_module(f"solutions.day{day}")
+
+
+def get_solve_function(module: ModuleType) -> TSolve:
+    """
+    get_solve_function get the callable that solves both parts from the raw input
+
+    Args:
+        module (ModuleType): a day solution module
+
+    Returns:
+        TSolve: the module's `solve` callable or, if missing, its `solution` callable
+    """
+    solve = getattr(module, "solve", None) or getattr(module, "solution", None)
+    if solve is None:
+        raise AttributeError(f"{module.__name__} has neither `solve` nor `solution`")
+    return solve
+
+
+def get_input_filename(day: int) -> str:
+    """
+    get_input_filename get the name of the input file of a day
+
+    Args:
+        day (int): the day number
+
+    Returns:
+        str: the input file name inside the inputs folder
+    """
+    return f"day{day}.txt"
+
+
+def parse_day_filter(selectors: list[str], available_days: list[int]) -> list[int]:
+    """
+    parse_day_filter select the days matching the given selectors
+
+    Args:
+        selectors (list[str]): day numbers or inclusive ranges (ex: ["1", "3", "8-11"]),
+        an empty list selects every available day
+        available_days (list[int]): the days that have a solution module
+
+    Returns:
+        list[int]: the sorted list of selected days
+
+    Raises:
+        ValueError: if a selector is malformed, a range is reversed (ex: "3-1")
+        or a selected day has no solution
+    """
+    if not selectors:
+        return available_days
+
+    def expand_selector(selector: str) -> range:
+        match selector.split("-"):
+            case [day]:
+                return range(int(day), int(day) + 1)
+            case [start, end]:
+                if int(start) > int(end):
+                    raise ValueError(
+                        f"Invalid day range {selector}, it ends before it starts"
+                    )
+                return range(int(start), int(end) + 1)
+            case _:
+                raise ValueError(f"Invalid day selector {selector}")
+
+    selected = {day for selector in selectors for day in expand_selector(selector)}
+    unknown = selected - set(available_days)
+    if unknown:
+        raise ValueError(f"No solution for days {sorted(unknown)}")
+    return sorted(selected)
@@ -0,0 +1,128 @@
+import hashlib
+import io
+import time
+import traceback
+from contextlib import redirect_stdout
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from runner.registry import get_input_filename, get_solve_function, load_day_module
+from utils import func
+from utils.inputs import read_inputs
+
+
+@dataclass
+class DayResult:
+    day: int
+    answer: Any = None
+    wall_time: float = 0.0
+    cpu_time: float = 0.0
+    output: str = ""
+    error: str | None = None
+    trace: dict | None = None
+    peak_memory: int | None = None
+    net_allocated: int | None = None
+    input_size: int = 0
+    input_hash: str | None = None
+    peak_rss: int | None = None
+
+
+def reset_peak_rss() -> bool:
+    """
+    reset_peak_rss reset the peak resident set size of this process to its
+    current resident set size, so the next peak only covers what follows
+
+    Returns:
+        bool: whether the peak could be reset (Linux only)
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as f:
+            f.write("5")
+    except OSError:
+        return False
+    return True
+
+
+def get_peak_rss() -> int | None:
+    """
+    get_peak_rss get the highest resident set size of this process since
+    reset_peak_rss was last called
+
+    Returns:
+        int | None: the peak RSS in bytes, or None where it is not available
+    """
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    # reported in kibibytes
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def measure_solve(day: int, solve: Callable, raw_input: str) -> DayResult:
+    """
+    measure_solve solve an input and measure how long it took, letting any
+    error of the solution propagate
+
+    Args:
+        day (int): the day number
+        solve (Callable): the function solving both parts from the raw input
+        raw_input (str): the input to solve
+
+    Returns:
+        DayResult: the answer, the wall-clock and CPU time, the size and hash of
+        the input and the peak RSS of the solve where it can be measured (plus the
+        peak memory and net allocations when tracing memory)
+    """
+    result = DayResult(day)
+    can_reset_peak_rss = reset_peak_rss()
+    wall_start, cpu_start = time.perf_counter(), time.process_time()
+    if func.TRACE_MEMORY:
+        result.answer, result.peak_memory, result.net_allocated = func.measure_memory(
+            solve, raw_input
+        )
+    else:
+        result.answer = solve(raw_input)
+    result.wall_time = time.perf_counter() - wall_start
+    result.cpu_time = time.process_time() - cpu_start
+    # without a reset the peak would cover everything the process ran before,
+    # which in a reused worker or the daemon is not this solve
+    result.peak_rss = get_peak_rss() if can_reset_peak_rss else None
+    encoded_input = raw_input.encode()
+    result.input_size = len(encoded_input)
+    result.input_hash = hashlib.sha256(encoded_input).hexdigest()
+    return result
+
+
+def solve_day(day: int, raw_input: str | None = None) -> DayResult:
+    """
+    solve_day solve a day and measure how long it took
+
+    Args:
+        day (int): the day number
+        raw_input (str | None): the input to solve, defaults to the day's input file
+
+    Returns:
+        DayResult: the measures of measure_solve and the printed output (plus the
+        stage statistics when tracing), or the formatted traceback if the
+        solution failed
+    """
+    result = DayResult(day)
+    output = io.StringIO()
+    func.TRACE_STATS.clear()
+    try:
+        solve = get_solve_function(load_day_module(day))
+        if raw_input is None:
+            raw_input = read_inputs(get_input_filename(day))
+        with redirect_stdout(output):
+            result = measure_solve(day, solve, raw_input)
+    except Exception:
+        result.error = traceback.format_exc()
+    result.output = output.getvalue()
+    if func.TRACE_ENABLED:
+        result.trace = func.TRACE_STATS.copy()
+        func.TRACE_STATS.clear()
+    return result
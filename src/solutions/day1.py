@@ -1,13 +1,29 @@
-from typing import Callable
+import heapq
+from array import array
+from itertools import chain
+from typing import Any, Callable, Iterable, Sequence
 
-from toolz import compose_left, juxt
 from toolz.curried import tail
 
-from utils.func import do_print
-from utils.inputs import read_inputs
+from utils.func import compose_left, do_print, juxt_pipelines
+from utils.incremental import IncrementalFold
+from utils.lazy import lazy_import, optional_import
+from utils.inputs import (
+    TBuffer,
+    get_input_path,
+    iter_paragraphs,
+    map_inputs,
+    read_inputs,
+    split_byte_ranges,
+)
+from utils.parallel import get_available_cores
+from utils.parse import extract_int_groups, to_bytes
+
+futures = lazy_import("concurrent.futures")
+np = optional_import("numpy")
 
 
-def parse_calories_groups(raw_input: str) -> list[list[int]]:
+def parse_calories_groups(raw_input: str) -> list[array]:
     """
 
     Args:
@@ -17,16 +33,10 @@ def parse_calories_groups(raw_input: str) -> list[list[int]]:
         the calories grouped in a list for each elf
 
     """
-    calories_groups = raw_input.split("\n\n")
-
-    def parse_calories_group(calories_group: str) -> list[int]:
-        calories = calories_group.splitlines()
-        return [int(calorie) for calorie in calories]
-
-    return list(map(parse_calories_group, calories_groups))
+    return extract_int_groups(raw_input)
 
 
-def get_sum_of_calories_per_elf(calories_groups: list[list[int]]) -> list[int]:
+def get_sum_of_calories_per_elf(calories_groups: list[array]) -> list[int]:
     """
 
     Args:
@@ -55,9 +65,260 @@ part_2 = compose_left(
     do_print("The three richest elves have {} calories in total."),
 )
 
-solution: Callable[[str], tuple[int, int]] = juxt(part_1, part_2)
+
+def get_top_calories(paragraphs: Iterable[bytes], k: int = 3) -> list[int]:
+    """
+    get_top_calories get the k largest sums of calories in a single pass,
+    keeping only a min-heap of the k largest sums seen so far
+
+    Args:
+        paragraphs (Iterable[bytes]): the calories of each elf, one per line
+        k (int): the number of sums to keep
+
+    Returns:
+        list[int]: the k largest sums (fewer if there are fewer elves),
+        in increasing order
+    """
+    top_calories: list[int] = []
+    for paragraph in paragraphs:
+        calories = sum(map(int, paragraph.split()))
+        if len(top_calories) < k:
+            heapq.heappush(top_calories, calories)
+        elif calories > top_calories[0]:
+            heapq.heapreplace(top_calories, calories)
+    return sorted(top_calories)
+
+
+def get_calories_answers(top_calories: Sequence[int]) -> tuple[int, int]:
+    """
+    get_calories_answers get the answers of both parts from the largest sums
+
+    Args:
+        top_calories (Sequence[int]): the largest sums, in increasing order
+
+    Returns:
+        tuple[int, int]: the calories of the richest elf and of the richest
+        elves, (0, 0) without any elf like the reference on an empty input
+    """
+    return (top_calories[-1] if top_calories else 0), sum(top_calories)
+
+
+def solve_streaming(raw_input: str | TBuffer, k: int = 3) -> tuple[int, int]:
+    """
+    solve_streaming solve both parts reading the elves one at a time, in memory
+    bounded by k whatever the number of elves when given a mapped file
+
+    Args:
+        raw_input (str | TBuffer): the input, or its file mapped by map_inputs
+        k (int): the number of richest elves whose calories part 2 sums
+
+    Returns:
+        tuple[int, int]: the calories of the richest elf and of the k richest
+    """
+    buffer = raw_input.encode() if isinstance(raw_input, str) else raw_input
+    top_calories = get_top_calories(iter_paragraphs(buffer), k)
+    return get_calories_answers(top_calories)
+
+
+def get_sum_of_calories_per_elf_numpy(raw_input: str | bytes) -> Any:
+    """
+    get_sum_of_calories_per_elf_numpy sum the calories of each elf with NumPy,
+    every number parsed into one array and summed per elf by a segmented
+    reduction between the blank lines
+
+    The numbers are parsed by place value, one pass over all the lines per digit,
+    so every line must be a number made of digits only or a blank line (a line
+    with any other byte, even a carriage return, raises like the reference).
+
+    Args:
+        raw_input (str | bytes): the calories of each elf grouped in paragraphs
+
+    Returns:
+        numpy.ndarray: the sum of the calories of each elf
+
+    Raises:
+        ModuleNotFoundError: if NumPy is not installed
+        ValueError: if a line is neither digits only nor blank
+    """
+    if np is None:
+        raise ModuleNotFoundError("NumPy is not installed", name="numpy")
+    data = np.frombuffer(to_bytes(raw_input).strip(), dtype=np.uint8)
+    is_line_feed = data == ord("\n")
+    if not np.all(is_line_feed | ((data >= ord("0")) & (data <= ord("9")))):
+        raise ValueError("Invalid calories, every line must be digits or blank")
+    line_feeds = np.flatnonzero(is_line_feed)
+    line_ends = np.append(line_feeds, len(data))
+    line_lengths = line_ends - np.append(0, line_feeds + 1)
+    is_number = line_lengths > 0
+    number_ends, number_lengths = line_ends[is_number], line_lengths[is_number]
+
+    calories = np.zeros(len(number_ends), dtype=np.int64)
+    for place in range(number_lengths.max(initial=0)):
+        digits = data[number_ends - 1 - place].astype(np.int64) - ord("0")
+        calories += np.where(number_lengths > place, digits, 0) * 10**place
+    if len(calories) == 0:
+        # like the reference, an empty input is a single elf carrying nothing
+        return np.zeros(1, dtype=np.int64)
+
+    # the k-th blank line, line j + 1 when its line feed directly follows the
+    # j-th one, starts the next elf after the j + 1 - k numbers above it
+    blank_lines = np.flatnonzero(np.diff(line_feeds) == 1) + 1
+    elf_starts = np.append(0, blank_lines - np.arange(len(blank_lines)))
+    # several blank lines in a row start the same elf once
+    elf_starts = elf_starts[np.append(True, np.diff(elf_starts) > 0)]
+    return np.add.reduceat(calories, elf_starts)
+
+
+def solve_numpy(raw_input: str | bytes, k: int = 3) -> tuple[int, int]:
+    """
+    solve_numpy solve both parts with NumPy, selecting the k largest sums with
+    a partial sort instead of sorting all of them
+
+    Args:
+        raw_input (str | bytes): the calories of each elf grouped in paragraphs
+        k (int): the number of richest elves whose calories part 2 sums
+
+    Returns:
+        tuple[int, int]: the calories of the richest elf and of the k richest
+
+    Raises:
+        ModuleNotFoundError: if NumPy is not installed
+        ValueError: if a line is neither digits only nor blank
+    """
+    sums = get_sum_of_calories_per_elf_numpy(raw_input)
+    top_calories = np.partition(sums, -k)[-k:] if len(sums) > k else sums
+    return int(top_calories.max()), int(top_calories.sum())
+
+
+# The smallest byte range worth sending to a worker process
+MIN_RANGE_BYTES = 1024 * 1024
+
+
+def get_range_top_calories(path: str, start: int, end: int, k: int) -> list[int]:
+    """
+    get_range_top_calories get the k largest sums of calories of a byte range of
+    an input file, the work of one worker process
+
+    Args:
+        path (str): the input file, mapped by the worker itself
+        start (int): the offset of the first paragraph of the range
+        end (int): the offset the range ends at
+        k (int): the number of sums to keep
+
+    Returns:
+        list[int]: the k largest sums of the range, in increasing order
+    """
+    with map_inputs(path) as buffer:
+        return get_top_calories(iter_paragraphs(buffer, start, end), k)
+
+
+def solve_parallel(
+    path: str, workers: int | None = None, k: int = 3
+) -> tuple[int, int]:
+    """
+    solve_parallel solve both parts of a huge input file in worker processes,
+    each finding the top k sums of a range of paragraphs, merged at the end
+
+    The file is split into a few ranges per worker, aligned on blank lines, and
+    each worker maps the file itself so only the offsets are sent to it. How
+    the speedup grows with the number of cores has not been measured.
+
+    Args:
+        path (str): the input file
+        workers (int | None): the number of worker processes, default the cores
+        this process may run on
+        k (int): the number of richest elves whose calories part 2 sums
+
+    Returns:
+        tuple[int, int]: the calories of the richest elf and of the k richest
+    """
+    workers = workers or get_available_cores()
+    with map_inputs(path) as buffer:
+        parts = min(workers * 4, len(buffer) // MIN_RANGE_BYTES)
+        ranges = split_byte_ranges(buffer, parts)
+        if len(ranges) < 2:
+            top_calories = get_top_calories(iter_paragraphs(buffer), k)
+    if len(ranges) >= 2:
+        with futures.ProcessPoolExecutor(
+            max_workers=min(workers, len(ranges))
+        ) as executor:
+            tops = executor.map(
+                get_range_top_calories,
+                *zip(*((path, start, end, k) for start, end in ranges)),
+            )
+            top_calories = sorted(heapq.nlargest(k, chain.from_iterable(tops)))
+    return get_calories_answers(top_calories)
+
+
+# The calories of the elf being read (None between two elves)
+# and the three largest sums of the elves already read, in increasing order
+TCaloriesState = tuple[int | None, tuple[int, ...]]
+
+
+def close_elf(state: TCaloriesState) -> TCaloriesState:
+    """
+    close_elf add the calories of the elf being read to the three largest sums
+
+    Args:
+        state (TCaloriesState): the state of the fold
+
+    Returns:
+        TCaloriesState: the state without an elf being read
+    """
+    calories, top_calories = state
+    if calories is None:
+        return state
+    return None, tuple(sorted(heapq.nlargest(3, (*top_calories, calories))))
+
+
+def fold_calories_line(state: TCaloriesState, line: bytes) -> TCaloriesState:
+    """
+    fold_calories_line fold a line of the input, the calories of an item
+    or a blank line ending an elf
+
+    Args:
+        state (TCaloriesState): the state of the fold
+        line (bytes): the line
+
+    Returns:
+        TCaloriesState: the state with the line folded in
+    """
+    if not line.strip():
+        return close_elf(state)
+    calories, top_calories = state
+    return (calories or 0) + int(line), top_calories
+
+
+def finish_calories(state: TCaloriesState) -> tuple[int, int]:
+    """
+    finish_calories get the answers of both parts from the state of the fold
+
+    Args:
+        state (TCaloriesState): the state of the fold
+
+    Returns:
+        tuple[int, int]: the calories of the richest elf and of the three richest
+    """
+    _, top_calories = close_elf(state)
+    return get_calories_answers(top_calories)
+
+
+# Both parts as a fold over the lines, to only fold the lines appended to the input
+incremental = IncrementalFold(
+    initial=(None, ()), step=fold_calories_line, finish=finish_calories
+)
+
+solution: Callable[[str], tuple[int, int]] = juxt_pipelines(part_1, part_2)
 
 if __name__ == "__main__":
+    from runner.records import record_day_run
+
     raw_input = read_inputs("day1.txt")
-    results = solution(raw_input)
+    results = record_day_run(1, solution, raw_input)
     assert results == (71124, 204639), f"Wrong answers {results}"
+    with map_inputs("day1.txt") as buffer:
+        assert solve_streaming(buffer) == results, "Wrong streaming answers"
+    parallel_results = solve_parallel(get_input_path("day1.txt"))
+    assert parallel_results == results, "Wrong parallel answers"
+    if np is not None:
+        assert solve_numpy(raw_input) == results, "Wrong NumPy answers"
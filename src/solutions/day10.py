@@ -1,10 +1,10 @@
 from functools import reduce
 from typing import Callable
 
-from toolz import compose_left, juxt, curry
+from toolz import curry
 from toolz.curried import partition
 
-from utils.func import do_print
+from utils.func import compose_left, do_print, juxt_pipelines
 from utils.inputs import read_inputs
 from utils.iterables import join_to_str
 
@@ -14,6 +14,7 @@ TCommand = Callable[[TRegisterValue], TRegisterCycles]
 
 SCREEN_COLUMNS = 40
 SCREEN_ROWS = 6
+SIGNAL_CYCLES = [20, 60, 100, 140, 180, 220]
 TSCREEN = list[list[str]]
 
 
@@ -148,7 +149,7 @@ def generate_screen_output(screen: TSCREEN) -> str:
 part_1: Callable[[str], int] = compose_left(
     parse_input,
     apply_commands,
-    get_signal_strengths([20, 60, 100, 140, 180, 220]),
+    get_signal_strengths(SIGNAL_CYCLES),
     sum,
     do_print("The sum of these six signal strengths is {}."),
 )
@@ -161,9 +162,56 @@ part_2: Callable[[str], str] = compose_left(
     do_print("The screen will display:\n{}"),
 )
 
-solve: Callable[[str], tuple[int, str]] = juxt(part_1, part_2)
+solve: Callable[[str], tuple[int, str]] = juxt_pipelines(part_1, part_2)
+
+
+def run_program(
+    raw_input: str, init_register_value: TRegisterValue = 1
+) -> TRegisterCycles:
+    """
+    run_program get the register values of every cycle by appending to a single list,
+    instead of copying the register for every command like apply_commands
+    Args:
+        raw_input (str): the program, one command per line
+        init_register_value (TRegisterValue): the initial value of the register
+
+    Returns:
+        TRegisterCycles: the value of the register at every cycle
+    """
+    register = [init_register_value]
+    value = init_register_value
+    for command in raw_input.splitlines():
+        match command.split(" "):
+            case ["noop"]:
+                register.append(value)
+            case ["addx", x]:
+                register.append(value)
+                value += int(x)
+                register.append(value)
+            case _:
+                raise ValueError(f"Unknown command {command}")
+    return register
+
+
+def solve_fast(raw_input: str) -> tuple[int, str]:
+    """
+    solve_fast solve both parts from the register values of run_program
+    Args:
+        raw_input (str): the program, one command per line
+
+    Returns:
+        tuple[int, str]: the sum of the signal strengths and the screen output
+    """
+    register = run_program(raw_input)
+    return (
+        sum(get_signal_strengths(SIGNAL_CYCLES, register)),
+        generate_screen_output(generate_crt(register)),
+    )
+
 
 if __name__ == "__main__":
+    from runner.records import record_day_run
+
     raw_commands = read_inputs("day10.txt")
-    (part_1, _) = solve(raw_commands)
+    (part_1, _) = record_day_run(10, solve, raw_commands)
     assert part_1 == 11720, f"Wrong answers {part_1}"
@@ -1,14 +1,14 @@
 import operator
-import re
 from copy import deepcopy
 from dataclasses import dataclass
 from functools import partial
 from typing import Callable, Final
-from toolz import curry, compose_left, pipe, juxt
+from toolz import curry, juxt
 from toolz.curried import reduce, take, map
 
-from utils.func import apply, do_print
-from utils.inputs import read_inputs
+from utils.func import apply, compose_left, do_print, pipe
+from utils.inputs import cached_parser, read_inputs
+from utils.parse import extract_ints
 
 
 @dataclass
@@ -28,10 +28,10 @@ class Monkey:
                 case ["Monkey", ID]:
                     self.id = int(ID[:-1])
                 case ["Starting", "items:", *_]:
-                    self.items = [int(item) for item in re.findall(r"\d+", line)]
+                    self.items = extract_ints(line).tolist()
                 case ["Operation:", "new", "=", 'old', operation, value]:
-                    self.inspect_operation = lambda x: OPERATIONS_MAP[operation](
-                        x, int(value) if value != "old" else x
+                    self.inspect_operation = partial(
+                        apply_operation, operation, value
                     )
                 case ["Test:", "divisible", "by", denominator]:
                     self.test_denominator = int(denominator)
@@ -53,6 +53,11 @@ OPERATIONS_MAP: Final = {
 }
 
 
+def apply_operation(operation: str, value: str, old: int) -> int:
+    return OPERATIONS_MAP[operation](old, int(value) if value != "old" else old)
+
+
+@cached_parser
 def parse_input(text: str) -> MonkeyGroup:
     return MonkeyGroup([Monkey(data) for data in text.split("\n\n")])
 
@@ -129,7 +134,11 @@ def part_2(group: MonkeyGroup) -> int:
 
 solution = juxt(part_1, part_2)
 
+solve = compose_left(parse_input, solution)
+
 if __name__ == "__main__":
+    from runner.records import record_day_run
+
     raw_input = read_inputs("day11.txt")
-    monkey_group = parse_input(raw_input)
-    assert solution(monkey_group) == (50830, 14399640002)
+    results = record_day_run(11, solve, raw_input)
+    assert results == (50830, 14399640002), f"Wrong answers {results}"
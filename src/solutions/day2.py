@@ -1,11 +1,15 @@
+from dataclasses import dataclass
+from itertools import permutations
 from operator import eq
-from typing import cast, Callable
+from typing import cast, Callable, Iterable
 
-from toolz import first, juxt, pipe
+from toolz import first, juxt
 from toolz.curried import map
 
-from utils.func import do_print
+from utils.func import do_print, pipe
+from utils.incremental import IncrementalFold
 from utils.inputs import read_inputs
+from utils.parse import to_bytes
 
 WINNING_COMBINATIONS = [
     (3, 1),
@@ -176,9 +180,191 @@ def part_2(raw_input: str) -> int:
     return cast(int, result)
 
 
+@dataclass(frozen=True)
+class Strategy:
+    """
+    What the second column of the strategy guide means: the move to play
+    or the outcome of the round, and the number X, Y and Z each stand for
+    (1, 2, 3 as rock, paper, scissors or as lose, draw, win)
+    """
+
+    meaning: str
+    mapping: tuple[int, int, int]
+
+
+STRATEGY_MEANINGS = ("move", "outcome")
+PART_1_STRATEGY = Strategy("move", (1, 2, 3))
+PART_2_STRATEGY = Strategy("outcome", (1, 2, 3))
+
+
+def get_strategy_scores(strategy: Strategy) -> dict[bytes, int]:
+    """
+    get_strategy_scores score every possible line of the input for a strategy
+
+    Args:
+        strategy (Strategy): what the second column means
+
+    Returns:
+        dict[bytes, int]: the score of each line (ex: b"A Y")
+
+    Raises:
+        ValueError: if the strategy has an unknown meaning or number
+    """
+    invalid_numbers = set(strategy.mapping) - {1, 2, 3}
+    if strategy.meaning not in STRATEGY_MEANINGS or invalid_numbers:
+        raise ValueError(f"Invalid strategy {strategy}")
+    scores = {}
+    for opponent in "ABC":
+        for mine, number in zip("XYZ", strategy.mapping):
+            opponent_move, _ = replace_moves_with_numbers([opponent, mine])
+            one_round = (opponent_move, number)
+            if strategy.meaning == "outcome":
+                one_round = calculate_round_outcome(one_round)
+            scores[f"{opponent} {mine}".encode()] = calculate_round_score(one_round)
+    return scores
+
+
+def get_round_scores() -> dict[bytes, tuple[int, int]]:
+    """
+    get_round_scores score every possible line of the input for both parts
+
+    Returns:
+        dict[bytes, tuple[int, int]]: the score of each line (ex: b"A Y")
+        read as two moves and read as a move and an outcome
+    """
+    scores_1 = get_strategy_scores(PART_1_STRATEGY)
+    scores_2 = get_strategy_scores(PART_2_STRATEGY)
+    return {line: (scores_1[line], scores_2[line]) for line in scores_1}
+
+
+ROUND_SCORES = get_round_scores()
+# The length of every line of a round (ex: b"A Y")
+ROUND_LENGTH = 3
+
+
+def fold_round_line(state: tuple[int, int], line: bytes) -> tuple[int, int]:
+    """
+    fold_round_line add the scores of a round to the total scores of both parts
+
+    Args:
+        state (tuple[int, int]): the total scores so far
+        line (bytes): the round (ex: b"A Y")
+
+    Returns:
+        tuple[int, int]: the total scores with the round
+    """
+    line = line.strip()
+    if not line:
+        return state
+    if line not in ROUND_SCORES:
+        raise ValueError(f"Invalid round {line.decode(errors='replace')}")
+    score_1, score_2 = ROUND_SCORES[line]
+    return state[0] + score_1, state[1] + score_2
+
+
+def get_round_histogram(raw_input: str | bytes) -> dict[bytes, int]:
+    """
+    get_round_histogram count the rounds of each of the 9 possible lines,
+    with one C-level scan of the input per line instead of parsing every round
+
+    Args:
+        raw_input (str | bytes): the rounds of the game, one per line
+
+    Returns:
+        dict[bytes, int]: the number of rounds of each line (ex: b"A Y")
+
+    Raises:
+        ValueError: if a line is not one of the 9 possible rounds
+    """
+    rounds = to_bytes(raw_input).strip()
+    buffer = rounds + b"\n" if rounds else b""
+    histogram = {line: buffer.count(line + b"\n") for line in ROUND_SCORES}
+    # a match can end inside a longer line (b"BA Y"), but when every line feed
+    # ends a match and every line is as long as a round, each line is a round
+    line_count = buffer.count(b"\n")
+    if (
+        sum(histogram.values()) != line_count
+        or len(buffer) != line_count * (ROUND_LENGTH + 1)
+    ):
+        raise ValueError("Invalid rounds, every line must be one of the 9 rounds")
+    return histogram
+
+
+def solve_histogram(raw_input: str | bytes) -> tuple[int, int]:
+    """
+    solve_histogram solve both parts from the number of rounds of each line,
+    dotted with the score of each line in both parts
+
+    Args:
+        raw_input (str | bytes): the rounds of the game, one per line
+
+    Returns:
+        tuple[int, int]: the total scores of both parts
+    """
+    histogram = get_round_histogram(raw_input)
+    score_1, score_2 = (
+        sum(count * ROUND_SCORES[line][part] for line, count in histogram.items())
+        for part in (0, 1)
+    )
+    return score_1, score_2
+
+
+def get_permutation_strategies() -> list[Strategy]:
+    """
+    get_permutation_strategies get every strategy where X, Y and Z stand for
+    different moves or different outcomes
+
+    Returns:
+        list[Strategy]: the 6 move strategies then the 6 outcome strategies
+    """
+    return [
+        Strategy(meaning, cast(tuple[int, int, int], mapping))
+        for meaning in STRATEGY_MEANINGS
+        for mapping in permutations((1, 2, 3))
+    ]
+
+
+def score_strategies(
+    raw_input: str | bytes, strategies: Iterable[Strategy] | None = None
+) -> dict[Strategy, int]:
+    """
+    score_strategies get the total score of many strategies from a single
+    histogram of the rounds, so each strategy only costs 9 multiplications
+    whatever the number of rounds
+
+    Args:
+        raw_input (str | bytes): the rounds of the game, one per line
+        strategies (Iterable[Strategy] | None): the strategies to score,
+        defaults to every permutation strategy
+
+    Returns:
+        dict[Strategy, int]: the total score of each strategy
+    """
+    histogram = get_round_histogram(raw_input)
+    if strategies is None:
+        strategies = get_permutation_strategies()
+    scores = {}
+    for strategy in strategies:
+        strategy_scores = get_strategy_scores(strategy)
+        scores[strategy] = sum(
+            count * strategy_scores[line] for line, count in histogram.items()
+        )
+    return scores
+
+
+# Both parts as a fold over the lines, to only fold the lines appended to the input
+incremental = IncrementalFold(initial=(0, 0), step=fold_round_line, finish=tuple)
+
 solution = juxt(part_1, part_2)
 
 if __name__ == "__main__":
+    from runner.records import record_day_run
+
     raw_instructions = read_inputs("day2.txt")
-    results = solution(raw_instructions)
+    results = record_day_run(2, solution, raw_instructions)
     assert results == (14297, 10498), f"Wrong answers {results}"
+    assert solve_histogram(raw_instructions) == results, "Wrong histogram answers"
+    strategy_scores = score_strategies(raw_instructions)
+    assert (strategy_scores[PART_1_STRATEGY], strategy_scores[PART_2_STRATEGY]) == (
+        results
+    ), "Wrong strategy scores"
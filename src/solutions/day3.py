@@ -1,11 +1,29 @@
+import builtins
+import functools
 import string
-from typing import Callable
+from operator import and_, or_
+from typing import Any, Callable, Iterable, Iterator
 
-from toolz import juxt, curry
-from toolz.curried import map, pipe
+from toolz import curry
+from toolz.curried import map, partition_all, reduce
 
-from utils.func import apply, do_print
+from utils.func import apply, compose_left, do_print, juxt_pipelines
+from utils.incremental import IncrementalFold
 from utils.inputs import read_inputs
+from utils.lazy import optional_import
+from utils.parse import to_bytes
+
+np = optional_import("numpy")
+
+# The bit of each byte in a rucksack mask, bit n - 1 for an item of priority n
+# and no bit for the bytes that are not items
+ITEM_BITS = [
+    1 << string.ascii_letters.index(chr(byte))
+    if chr(byte) in string.ascii_letters
+    else 0
+    for byte in range(256)
+]
+ALL_ITEMS = (1 << len(string.ascii_letters)) - 1
 
 
 def get_letter_priority(letter: str) -> int:
@@ -89,58 +107,279 @@ def deep_intersection(list_of_lists: list[list]) -> set:
     return set.intersection(*map(set, list_of_lists))
 
 
-def part_1(raw_input: str) -> int:
+# The sum of the priority of the items that are in both compartments of the bag
+part_1: Callable[[str], int] = compose_left(
+    str.splitlines,
+    map(split_in_half),
+    map(apply(get_list_intersection)),
+    map(set),
+    map(sum_priority_per_bag),
+    sum,
+    do_print(
+        "The sum of the priority of the items in both compartments of the bag is {}."
+    ),
+)
+
+# The sum of the priorities of badge items
+# (badge items are items common in the bag of all three elfs in a group)
+part_2: Callable[[str], int] = compose_left(
+    str.splitlines,
+    split_into_chunks(3),
+    map(deep_intersection),
+    map(set),
+    map(sum_priority_per_bag),
+    sum,
+    do_print("The sum of the priorities of badge items is {}."),
+)
+
+
+def get_rucksack_mask(items: bytes) -> int:
+    """
+    get_rucksack_mask get the items of a rucksack as a 52 bits mask
+
+    Args:
+        items (bytes): the items of the rucksack or of a compartment
+
+    Returns:
+        int: the mask with the bit of every item in the rucksack set
+    """
+    # the builtin map and reduce, the curried ones cost a call per rucksack
+    return functools.reduce(or_, builtins.map(ITEM_BITS.__getitem__, items), 0)
+
+
+def get_mask_priority(mask: int) -> int:
+    """
+    get_mask_priority sum the priorities of the items of a mask,
+    the priority of an item being the position of its bit plus one
+
+    Args:
+        mask (int): the mask of the items
+
+    Returns:
+        int: the sum of the priorities of the items
+    """
+    if not mask & (mask - 1):
+        # a single item (or none), the common case
+        return mask.bit_length()
+    priority = 0
+    while mask:
+        lowest_bit = mask & -mask
+        priority += lowest_bit.bit_length()
+        mask ^= lowest_bit
+    return priority
+
+
+def solve_bitmask(raw_input: str | bytes) -> tuple[int, int]:
+    """
+    solve_bitmask solve both parts with the rucksacks as masks of their items,
+    so intersections are a bitwise and and no set is built
+
+    Args:
+        raw_input (str | bytes): the items of each rucksack, one per line
+
+    Returns:
+        tuple[int, int]: the sums of the priorities of both parts
+    """
+    # a blank line is an empty rucksack, as in the reference
+    bags = to_bytes(raw_input).splitlines()
+    first_masks = [get_rucksack_mask(bag[: len(bag) // 2]) for bag in bags]
+    second_masks = [get_rucksack_mask(bag[len(bag) // 2 :]) for bag in bags]
+    rucksack_masks = map(or_, first_masks, second_masks)
+    priorities_1 = sum(map(get_mask_priority, map(and_, first_masks, second_masks)))
+    priorities_2 = sum(
+        map(get_mask_priority, map(reduce(and_), partition_all(3, rucksack_masks)))
+    )
+    return priorities_1, priorities_2
+
+
+def iter_window_masks(masks: Iterable[int], k: int) -> Iterator[int]:
+    """
+    iter_window_masks get the items common to every window of k consecutive
+    rucksacks, in amortized constant time per rucksack whatever k
+
+    The window is a queue made of two stacks: the rucksacks pushed at the back
+    with the and of all of them, and the rucksacks left at the front with the and
+    of each one and those behind it. When the front stack runs out, the back stack
+    is moved onto it, so every rucksack is anded a constant number of times.
+
+    Args:
+        masks (Iterable[int]): the masks of the rucksacks, in order
+        k (int): the number of rucksacks in a window
+
+    Returns:
+        Iterator[int]: the mask of the common items of each window, in order
+
+    Raises:
+        ValueError: if k is not positive
+    """
+    if k < 1:
+        raise ValueError(f"Invalid window size {k}")
+    back: list[int] = []
+    back_items = ALL_ITEMS
+    front_items: list[int] = []
+    for mask in masks:
+        back.append(mask)
+        back_items &= mask
+        if len(front_items) + len(back) > k:
+            if not front_items:
+                items = ALL_ITEMS
+                for back_mask in reversed(back):
+                    items &= back_mask
+                    front_items.append(items)
+                back.clear()
+                back_items = ALL_ITEMS
+            front_items.pop()
+        if len(front_items) + len(back) == k:
+            yield (front_items[-1] if front_items else ALL_ITEMS) & back_items
+
+
+def get_window_priorities(raw_input: str | bytes, k: int) -> list[int]:
+    """
+    get_window_priorities sum the priorities of the items common to every window
+    of k consecutive rucksacks (part 2 is every third window of 3 rucksacks)
+
+    Args:
+        raw_input (str | bytes): the items of each rucksack, one per line
+        k (int): the number of rucksacks in a window
+
+    Returns:
+        list[int]: the sum of the priorities of the common items of each window,
+        none if there are fewer than k rucksacks
     """
-    part_1 return the sum of priority of the items
-    that are in both compartments of the bag
+    # a blank line is an empty rucksack, as in the reference
+    rucksack_masks = map(get_rucksack_mask, to_bytes(raw_input).splitlines())
+    return list(map(get_mask_priority, iter_window_masks(rucksack_masks, k)))
+
+
+def get_masks_priority_numpy(masks: Any) -> int:
+    """
+    get_masks_priority_numpy sum the priorities of the items of many masks,
+    counting the masks with each of the 52 bits set
 
     Args:
-        raw_input (str): the raw input of the problem
+        masks (numpy.ndarray): the uint64 masks of the items
 
     Returns:
-        int: the sum of the priority of the letters
-        that are found in both compartments of the bag
+        int: the sum of the priorities of the items of all the masks
     """
-    return pipe(
-        raw_input,
-        lambda s: s.splitlines(),
-        map(split_in_half),
-        map(apply(get_list_intersection)),
-        map(set),
-        map(sum_priority_per_bag),
-        sum,
-        do_print(
-            "The sum of the priority of the items in both compartments of the bag is {}."
-        ),
+    return sum(
+        (bit + 1) * int(np.count_nonzero(masks & np.uint64(1 << bit)))
+        for bit in range(len(string.ascii_letters))
     )
 
 
-def part_2(raw_input: str) -> int:
+def solve_numpy(raw_input: str | bytes) -> tuple[int, int]:
     """
-    part_2 return the sum of priorities of badge items
-    (badge items are items common in the bag of all three elfs in a group)
+    solve_numpy solve both parts with NumPy over the whole input at once,
+    the masks of all the compartments built by segmented bitwise or reductions
 
     Args:
-        raw_input (str): the raw input of the problem
+        raw_input (str | bytes): the items of each rucksack, one per line
 
     Returns:
-        int: the sum of the priorities of badge items
+        tuple[int, int]: the sums of the priorities of both parts
+
+    Raises:
+        ModuleNotFoundError: if NumPy is not installed
     """
-    return pipe(
-        raw_input,
-        lambda s: s.splitlines(),
-        split_into_chunks(3),
-        map(deep_intersection),
-        map(set),
-        map(sum_priority_per_bag),
-        sum,
-        do_print("The sum of the priorities of badge items is {}."),
+    if np is None:
+        raise ModuleNotFoundError("NumPy is not installed", name="numpy")
+    data = np.frombuffer(to_bytes(raw_input).strip(), dtype=np.uint8)
+    if not len(data):
+        return 0, 0
+    item_bits = np.array(ITEM_BITS, dtype=np.uint64)[data]
+    line_feeds = np.flatnonzero(data == ord("\n"))
+    line_starts = np.append(0, line_feeds + 1)
+    half_lengths = (np.append(line_feeds, len(data)) - line_starts) // 2
+    # the first compartment of a line ends where the second starts and the
+    # second ends at the next line, its line feed having no bit
+    compartment_starts = np.column_stack((line_starts, line_starts + half_lengths))
+    compartment_masks = np.bitwise_or.reduceat(item_bits, compartment_starts.ravel())
+    # reduceat gives the item at its index for an empty compartment
+    first_masks = np.where(half_lengths > 0, compartment_masks[0::2], 0)
+    second_masks = compartment_masks[1::2]
+    priorities_1 = get_masks_priority_numpy(first_masks & second_masks)
+
+    # the missing rucksacks of a last group of less than three have every bit
+    rucksack_masks = first_masks | second_masks
+    padding = np.full(-len(rucksack_masks) % 3, np.iinfo(np.uint64).max)
+    group_masks = np.bitwise_and.reduce(
+        np.append(rucksack_masks, padding).reshape(-1, 3), axis=1
     )
+    return priorities_1, get_masks_priority_numpy(group_masks)
+
+
+# The sums of the priorities of both parts
+# and the bags of the group of three elves being read
+TPrioritiesState = tuple[int, int, tuple[str, ...]]
+
+
+def get_badge_priority(group: tuple[str, ...]) -> int:
+    """
+    get_badge_priority get the priority of the badge of a group of elves
+
+    Args:
+        group (tuple[str, ...]): the bags of the group
+
+    Returns:
+        int: the priority of the items common to all the bags of the group
+    """
+    return sum_priority_per_bag(set(deep_intersection(list(group))))
 
 
-solution: Callable[[str], tuple[int, int]] = juxt(part_1, part_2)
+def fold_bag_line(state: TPrioritiesState, line: bytes) -> TPrioritiesState:
+    """
+    fold_bag_line add the priorities of a bag to the sums of both parts,
+    the badge of its group once the group has its three bags
+
+    Args:
+        state (TPrioritiesState): the state of the fold
+        line (bytes): the bag
+
+    Returns:
+        TPrioritiesState: the state with the bag folded in
+    """
+    # a blank line is an empty bag, as in the reference
+    bag = line.strip().decode()
+    priorities_1, priorities_2, group = state
+    compartments_items = set(get_list_intersection(*split_in_half(bag)))
+    priorities_1 += sum_priority_per_bag(compartments_items)
+    group = (*group, bag)
+    if len(group) == 3:
+        return priorities_1, priorities_2 + get_badge_priority(group), ()
+    return priorities_1, priorities_2, group
+
+
+def finish_priorities(state: TPrioritiesState) -> tuple[int, int]:
+    """
+    finish_priorities get the answers of both parts from the state of the fold,
+    a last group of less than three bags counting as a group like in part 2
+
+    Args:
+        state (TPrioritiesState): the state of the fold
+
+    Returns:
+        tuple[int, int]: the sums of the priorities of both parts
+    """
+    priorities_1, priorities_2, group = state
+    return priorities_1, priorities_2 + (get_badge_priority(group) if group else 0)
+
+
+# Both parts as a fold over the lines, to only fold the lines appended to the input
+incremental = IncrementalFold(
+    initial=(0, 0, ()), step=fold_bag_line, finish=finish_priorities
+)
+
+solution: Callable[[str], tuple[int, int]] = juxt_pipelines(part_1, part_2)
 
 if __name__ == "__main__":
+    from runner.records import record_day_run
+
     raw_instructions = read_inputs("day3.txt")
-    results = solution(raw_instructions)
+    results = record_day_run(3, solution, raw_instructions)
     assert results == (8298, 2708), f"Wrong answers {results}"
+    assert solve_bitmask(raw_instructions) == results, "Wrong bitmask answers"
+    window_priorities = get_window_priorities(raw_instructions, 3)
+    assert sum(window_priorities[::3]) == results[1], "Wrong window priorities"
+    if np is not None:
+        assert solve_numpy(raw_instructions) == results, "Wrong NumPy answers"
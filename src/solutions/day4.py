@@ -1,48 +1,36 @@
-from typing import Iterable, Callable
+from typing import Callable, Iterable
 
-from more_itertools import ilen
-from toolz import juxt
-from toolz.curried import pipe, filter, map
+from toolz.curried import filter
 
-from utils.func import apply, do_print
+from utils.func import apply, compose_left, do_print, juxt_pipelines
+from utils.incremental import IncrementalFold
 from utils.inputs import read_inputs
+from utils.lazy import lazy_callable
+from utils.parse import extract_records
 
+ilen = lazy_callable("more_itertools", "ilen")
 
-def parse_range_pairs(range_pair_string: str) -> list[list[int]]:
+
+def parse_range_pairs(text: str | bytes) -> list[tuple[range, range]]:
     """
-    parse_range_pairs parse a string representation of a list of range pairs
-    (ex: "1-10,20-30") to a list of integers
+    parse_range_pairs parse the range pairs of every line (ex: "1-10,20-30")
+    to pairs of range objects
 
     Args:
-        range_pair_string (str): a string representation of a list of range pairs
-        (ex: "1-10,20-30")
+        text (str | bytes): the assignment pairs, one per line
 
     Returns:
-        list[list[int]]: the list of range lists
+        list[tuple[range, range]]: the pair of ranges of each line
 
+    Raises:
+        ValueError: if a line does not hold exactly 4 bounds
     """
     return [
-        transform_str_to_range(range_string)
-        for range_string in range_pair_string.split(",")
+        (range(start1, end1 + 1), range(start2, end2 + 1))
+        for start1, end1, start2, end2 in extract_records(text, 4)
     ]
 
 
-def transform_str_to_range(range_string: str) -> list[int]:
-    """
-    transform_str_to_range transform a string representation of range
-    (ex: "1-10") to a range object
-
-    Args:
-        range_string (str): a string representation of a range (ex: "1-10")
-
-    Returns:
-        range: a list of integers in the range
-
-    """
-    start, end = map(int, range_string.split("-"))
-    return list(range(start, end + 1))
-
-
 def sort_by_length(list_of_iterables: list[Iterable]) -> list[Iterable]:
     """
     sort_by_length sort the list by the length of the iterable elements
@@ -56,15 +44,13 @@ def sort_by_length(list_of_iterables: list[Iterable]) -> list[Iterable]:
     return sorted(list_of_iterables, key=len)
 
 
-def check_if_segments_include_each_other(
-    segment1: list[int], segment2: list[int]
-) -> bool:
+def check_if_segments_include_each_other(segment1: range, segment2: range) -> bool:
     """
     check_if_segments_include_each_other check if one segment is included in the other
 
     Args:
-        segment1 (list[int]): the first segment
-        segment2 (list[int]): the second segment
+        segment1 (range): the first segment
+        segment2 (range): the second segment
 
     Returns:
         bool: whether if one segment is included in the other
@@ -74,13 +60,13 @@ def check_if_segments_include_each_other(
     return all(element in longest_segment for element in shortest_segment)
 
 
-def check_if_segments_overlap(segment1: list[int], segment2: list[int]) -> bool:
+def check_if_segments_overlap(segment1: range, segment2: range) -> bool:
     """
     check_if_segments_overlap check if two segments overlap
 
     Args:
-        segment1 (list[int]): the first segment
-        segment2 (list[int]): the second segment
+        segment1 (range): the first segment
+        segment2 (range): the second segment
 
     Returns:
         bool: whether if the two segments overlap
@@ -90,47 +76,50 @@ def check_if_segments_overlap(segment1: list[int], segment2: list[int]) -> bool:
     return any(element in longest_segment for element in shortest_segment)
 
 
-def part_1(raw_input: str):
-    """
-    part_1 finds out how many assignment pairs fully contain the other
-    Args:
-        raw_input: a list of string representation of range pairs (ex: "1-10,20-30")
+# The number of assignment pairs where one range fully contains the other
+part_1: Callable[[str], int] = compose_left(
+    parse_range_pairs,
+    filter(apply(check_if_segments_include_each_other)),
+    ilen,
+    do_print("There are {} assignment pairs that fully contain the other."),
+)
 
-    Returns:
-        int: the number of assignment pairs that fully contain the other
-    """
-    return pipe(
-        raw_input,
-        lambda x: x.splitlines(),
-        map(parse_range_pairs),
-        filter(apply(check_if_segments_include_each_other)),
-        ilen,
-        do_print("There are {} assignment pairs that fully contain the other."),
-    )
+# The number of assignment pairs that overlap
+part_2: Callable[[str], int] = compose_left(
+    parse_range_pairs,
+    filter(apply(check_if_segments_overlap)),
+    ilen,
+    do_print("There are {} assignment pairs that overlap."),
+)
 
 
-def part_2(raw_input: str):
+def fold_pair_line(state: tuple[int, int], line: bytes) -> tuple[int, int]:
     """
-    part_2 finds out how many assignment pairs overlap
+    fold_pair_line count an assignment pair in the counts of both parts
+
     Args:
-        raw_input: a list of string representation of range pairs (ex: "1-10,20-30")
+        state (tuple[int, int]): the pairs fully containing the other
+        and the overlapping pairs counted so far
+        line (bytes): the assignment pair (ex: b"2-4,6-8")
 
     Returns:
-        int: the number of assignment pairs that overlap
+        tuple[int, int]: the counts with the pair
     """
-    return pipe(
-        raw_input,
-        lambda x: x.splitlines(),
-        map(parse_range_pairs),
-        filter(apply(check_if_segments_overlap)),
-        ilen,
-        do_print("There are {} assignment pairs that overlap."),
-    )
+    contained, overlapping = state
+    for segment1, segment2 in parse_range_pairs(line):
+        contained += check_if_segments_include_each_other(segment1, segment2)
+        overlapping += check_if_segments_overlap(segment1, segment2)
+    return contained, overlapping
 
 
-solution: Callable[[str], tuple[int, int]] = juxt(part_1, part_2)
+# Both parts as a fold over the lines, to only fold the lines appended to the input
+incremental = IncrementalFold(initial=(0, 0), step=fold_pair_line, finish=tuple)
+
+solution: Callable[[str], tuple[int, int]] = juxt_pipelines(part_1, part_2)
 
 if __name__ == "__main__":
+    from runner.records import record_day_run
+
     raw_instructions = read_inputs("day4.txt")
-    results = solution(raw_instructions)
+    results = record_day_run(4, solution, raw_instructions)
     assert results == (528, 881), f"Wrong answers {results}"
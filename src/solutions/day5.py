@@ -1,11 +1,9 @@
-import re
 from functools import reduce, partial
 from typing import Dict, Callable, cast
 
-from toolz.functoolz import compose_left
-
-from utils.func import do_print
-from utils.inputs import read_inputs
+from utils.func import compose_left, do_print
+from utils.inputs import cached_parser, read_inputs
+from utils.parse import extract_records
 
 ContainerStacksState = Dict[int, list[str]]
 MoveType = tuple[int, int, int]
@@ -32,6 +30,7 @@ def get_initial_stack_state() -> ContainerStacksState:
     return {key: list(stack) for key, stack in intial_state.items()}
 
 
+@cached_parser
 def parse_moves(text: str) -> list[MoveType]:
     """
     parse_moves parse the input string to tuples of integers
@@ -43,14 +42,7 @@ def parse_moves(text: str) -> list[MoveType]:
         list[MoveType]: a list of tuples of integers
         (number of craters to move, from stack, to stack)
     """
-
-    def parse_move(values):
-        return tuple(map(int, values))
-
-    pattern = re.compile(r"move (\d*) from (\d*) to (\d*)")
-    return cast(
-        list[MoveType], [parse_move(match.groups()) for match in pattern.finditer(text)]
-    )
+    return cast(list[MoveType], extract_records(text, 3))
 
 
 def move_craters(
@@ -113,6 +105,8 @@ solution: Callable[[str], str] = compose_left(
 )
 
 if __name__ == "__main__":
+    from runner.records import record_day_run
+
     raw_instructions = read_inputs("day5.txt")
-    result = solution(raw_instructions)
+    result = record_day_run(5, solution, raw_instructions)
     assert result == "BRZGFVBTJ", "You got the wrong answer!"
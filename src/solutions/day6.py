@@ -1,9 +1,9 @@
 from functools import reduce
 from typing import Callable
 
-from toolz import compose_left, juxt, curry
+from toolz import juxt, curry
 
-from utils.func import do_print
+from utils.func import compose_left, do_print
 from utils.inputs import read_inputs
 
 
@@ -58,6 +58,8 @@ part_2 = compose_left(
 solution: Callable[[str], tuple[int, int]] = juxt(part_1, part_2)
 
 if __name__ == "__main__":
+    from runner.records import record_day_run
+
     raw_input = read_inputs("day6.txt")
-    results = solution(raw_input)
+    results = record_day_run(6, solution, raw_input)
     assert results == (1766, 2383), f"Wrong answers {results}"
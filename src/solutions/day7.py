@@ -3,10 +3,10 @@ from functools import reduce
 from operator import ge, le
 from typing import Callable, Self
 
-from toolz import concat, compose_left, juxt, identity, curry
+from toolz import concat, juxt, identity, curry
 
-from utils.func import do_print, apply
-from utils.inputs import read_inputs
+from utils.func import do_print, apply, compose_left, juxt_pipelines
+from utils.inputs import cached_parser, read_inputs
 
 
 class FSComponent(ABC):
@@ -123,6 +123,7 @@ def parse_line(cwd: Folder, line: str) -> Folder:
     return cwd
 
 
+@cached_parser
 def parse_input(raw_input: str) -> Folder:
     """
     parse_input parse the input string into a file system tree
@@ -237,9 +238,69 @@ part_2 = compose_left(
     do_print("The size of the smallest folder that can be deleted is {}."),
 )
 
-solve = juxt(part_1, part_2)
+solve = juxt_pipelines(part_1, part_2)
+
+
+def get_folder_sizes(raw_input: str) -> list[int]:
+    """
+    get_folder_sizes get the size of every folder without building the tree,
+    keeping the sizes of the folders of the current path on a stack
+
+    Like parse_input, every "$ cd name" enters a new folder.
+
+    Args:
+        raw_input (str): the string containing the shell output from the device
+
+    Returns:
+        list[int]: the size of every folder, the root last
+    """
+    sizes: list[int] = []
+    path_sizes = [0]
+
+    def leave_folder() -> None:
+        size = path_sizes.pop()
+        sizes.append(size)
+        path_sizes[-1] += size
+
+    for line in raw_input.splitlines():
+        if line.startswith("$ cd"):
+            folder_name = line.split(" ")[2]
+            if folder_name == "..":
+                if len(path_sizes) > 1:
+                    leave_folder()
+            elif folder_name == "/":
+                while len(path_sizes) > 1:
+                    leave_folder()
+            else:
+                path_sizes.append(0)
+        elif line and not line.startswith("$") and not line.startswith("dir"):
+            path_sizes[-1] += int(line.split()[0])
+    while len(path_sizes) > 1:
+        leave_folder()
+    return [*sizes, path_sizes[0]]
+
+
+def solve_fast(raw_input: str) -> tuple[int, int]:
+    """
+    solve_fast solve both parts from the folder sizes alone
+
+    Args:
+        raw_input (str): the string containing the shell output from the device
+
+    Returns:
+        tuple[int, int]: the answers of both parts
+    """
+    sizes = get_folder_sizes(raw_input)
+    needed_size = 30_000_000 - (70_000_000 - sizes[-1])
+    return (
+        sum(size for size in sizes if size <= 100_000),
+        min([size for size in sizes if size >= needed_size]),
+    )
+
 
 if __name__ == "__main__":
+    from runner.records import record_day_run
+
     raw_input = read_inputs("day7.txt")
-    results = solve(raw_input)
+    results = record_day_run(7, solve, raw_input)
     assert results == (1391690, 5469168), f"Wrong answers {results}"
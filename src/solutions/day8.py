@@ -2,16 +2,18 @@ from functools import reduce
 from operator import mul
 from typing import Callable
 
-from toolz.functoolz import compose_left, curry, juxt
+from toolz import identity, second
+from toolz.functoolz import curry, juxt
 
-from utils.func import apply, do_print
-from utils.inputs import read_inputs
+from utils.func import apply, compose_left, do_print, juxt_pipelines
+from utils.inputs import cached_parser, read_inputs
 
 THeight = int
 TGrid = list[list[THeight]]
 TTreeCoordinates = tuple[int, int]
 
 
+@cached_parser
 def parse_tree_grid(text: str) -> TGrid:
     """
     parse_tree_grid transform the string form of a grid into a two-dimensional matrix
@@ -62,8 +64,8 @@ def is_tree_on_the_edge_of_the_grid(grid: TGrid, coordinates: TTreeCoordinates)
     Returns:
         boolean indicating if the tree is on the edge of the grid
     """
-    edge_indexes = {0, len(grid) - 1}
-    return any(coordinate in edge_indexes for coordinate in coordinates)
+    row_index, col_index = coordinates
+    return row_index in {0, len(grid) - 1} or col_index in {0, len(grid[0]) - 1}
 
 
 def is_tree_the_highest_in_its_region(
@@ -171,10 +173,28 @@ def calculate_scenic_score(grid: TGrid, coordinates: TTreeCoordinates) -> int:
     )
 
 
+def calculate_scenic_scores(grid: TGrid, trees: list[TTreeCoordinates]) -> list[int]:
+    """
+    calculate_scenic_scores returns the scenic scores of the given trees in the grid
+
+    Args:
+        grid: a two-dimensional matrix of tree heights
+        trees: the coordinates of the trees to score
+
+    Returns:
+        the scenic score of each tree
+    """
+    return list(map(calculate_scenic_score(grid), trees))
+
+
+# Pair the grid with its visible trees, both parts need them
+find_grid_and_visible_trees = juxt(identity, find_visible_trees)
+
 # Find the number of visible trees outside the grid
 part_1: Callable[[str], int] = compose_left(
     parse_tree_grid,
-    find_visible_trees,
+    find_grid_and_visible_trees,
+    second,
     len,
     do_print("The number of visible trees is: {}"),
 )
@@ -182,15 +202,17 @@ part_1: Callable[[str], int] = compose_left(
 # Find the highest scenic score for the grid
 part_2: Callable[[str], int] = compose_left(
     parse_tree_grid,
-    juxt(calculate_scenic_score, find_visible_trees),
-    apply(map),
+    find_grid_and_visible_trees,
+    apply(calculate_scenic_scores),
     max,
     do_print("The highest scenic score is: {}"),
 )
 
-solution: Callable[[str], tuple[int, int]] = juxt(part_1, part_2)
+solution: Callable[[str], tuple[int, int]] = juxt_pipelines(part_1, part_2)
 
 if __name__ == "__main__":
+    from runner.records import record_day_run
+
     raw_grid = read_inputs("day8.txt")
-    results = solution(raw_grid)
+    results = record_day_run(8, solution, raw_grid)
     assert results == (1851, 574080), f"Wrong answers {results}"
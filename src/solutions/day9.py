@@ -1,12 +1,11 @@
-import re
 from functools import reduce, partial
 from typing import Callable, cast, Literal
 
-from more_itertools import last
-from toolz import pipe, juxt, curry
+from toolz import curry, last
 
-from utils.func import do_print
-from utils.inputs import read_inputs
+from utils.func import compose_left, do_print, juxt_pipelines, pipe
+from utils.inputs import cached_parser, read_inputs
+from utils.parse import split_lines_tokens
 
 TPosition = tuple[int, int]
 TDirection = Literal["R", "L", "U", "D"]
@@ -228,6 +227,7 @@ def apply_moves(rope_length: int, moves: list[TMove]) -> list[TRope]:
     return reduce(apply_move, moves, [rope])
 
 
+@cached_parser
 def parse_moves(raw_input: str) -> list[TMove]:
     """
     parse_moves parse the input into a list of moves
@@ -237,15 +237,16 @@ def parse_moves(raw_input: str) -> list[TMove]:
 
     Returns:
         list[tuple[TDirection, int]]: a list of moves (direction, steps)
-    """
-
-    def parse_move(match) -> TMove:
-        direction, steps = match.groups()
-        return direction, int(steps)
 
-    pattern = re.compile(r"([A-Z]) (\d*)")
-
-    return [parse_move(match) for match in pattern.finditer(raw_input)]
+    Raises:
+        ValueError: if a line is not a direction letter and a number of steps
+    """
+    tokens = split_lines_tokens(raw_input, 2)
+    directions = b"".join(tokens[::2]).decode("ascii")
+    if len(directions) != len(tokens) // 2 or not directions.isalpha():
+        raise ValueError("Every move must start with a single direction letter")
+    steps = map(int, tokens[1::2])
+    return cast(list[TMove], list(zip(directions, steps)))
 
 
 @curry
@@ -274,12 +275,81 @@ def solution(rope_length: int, raw_input: str) -> int:
     )
 
 
-part_1 = solution(2)
-part_2 = solution(10)
+@curry
+def count_positions_visited_by_knot(knot_index: int, rope_tracker: list[TRope]) -> int:
+    """
+    count_positions_visited_by_knot count the positions visited by a knot of the rope
+
+    Args:
+        knot_index (int): the index of the knot in the rope (0 is the head)
+        rope_tracker (list[TRope]): all the positions of the rope
+
+    Returns:
+        int: the number of positions visited by the knot at least once
+    """
+    return len({rope[knot_index] for rope in rope_tracker})
+
+
+# A knot only follows the knot ahead of it, so the second knot of a 10-knot rope
+# moves exactly like the tail of a 2-knot rope and one simulation serves both parts
+part_1: Callable[[str], int] = compose_left(
+    parse_moves,
+    apply_moves(10),
+    count_positions_visited_by_knot(1),
+    do_print("The tail of a 2-knot rope has visited {} positions"),
+)
+
+part_2: Callable[[str], int] = compose_left(
+    parse_moves,
+    apply_moves(10),
+    count_positions_visited_by_knot(9),
+    do_print("The tail of a 10-knot rope has visited {} positions"),
+)
+
+solve = juxt_pipelines(part_1, part_2)
+
+DIRECTION_DELTAS: dict[TDirection, TPosition] = {
+    "R": (1, 0),
+    "L": (-1, 0),
+    "U": (0, 1),
+    "D": (0, -1),
+}
+
+
+def solve_fast(raw_input: str) -> tuple[int, int]:
+    """
+    solve_fast simulate a 10-knot rope in place, step by step, and only keep
+    the positions visited by the second and the last knots
+
+    Args:
+        raw_input (str): the raw input containing the list of moves
+
+    Returns:
+        tuple[int, int]: the positions visited by the tail of a 2-knot
+        and of a 10-knot rope
+    """
+    xs, ys = [0] * 10, [0] * 10
+    visited_by_second, visited_by_last = {(0, 0)}, {(0, 0)}
+    for direction, steps in parse_moves(raw_input):
+        step_x, step_y = DIRECTION_DELTAS[direction]
+        for _ in range(steps):
+            xs[0] += step_x
+            ys[0] += step_y
+            for knot in range(1, 10):
+                delta_x, delta_y = xs[knot - 1] - xs[knot], ys[knot - 1] - ys[knot]
+                if -1 <= delta_x <= 1 and -1 <= delta_y <= 1:
+                    # a knot that does not move does not pull the rest of the rope
+                    break
+                xs[knot] += (delta_x > 0) - (delta_x < 0)
+                ys[knot] += (delta_y > 0) - (delta_y < 0)
+            visited_by_second.add((xs[1], ys[1]))
+            visited_by_last.add((xs[9], ys[9]))
+    return len(visited_by_second), len(visited_by_last)
 
-solve = juxt(part_1, part_2)
 
 if __name__ == "__main__":
+    from runner.records import record_day_run
+
     raw_moves = read_inputs("day9.txt")
-    results = solve(raw_moves)
+    results = record_day_run(9, solve, raw_moves)
     assert results == (6018, 2619), f"Wrong answers {results}"
@@ -1,11 +1,32 @@
-from pprint import pprint
-from typing import Callable, TypeVar
+import atexit
+import os
+import sys
+import time
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Callable, Iterator, Sized, TypeVar
+
+import toolz
+from toolz import identity
+from toolz.functoolz import Compose
+
+from utils.lazy import lazy_import
+
+pprint = lazy_import("pprint")
+tracemalloc = lazy_import("tracemalloc")
+
+TRACE_ENABLED = False
+TRACE_MEMORY = False
 
 TReturn = TypeVar("TReturn")
 
 
 def apply(func: Callable[..., TReturn]) -> Callable[[tuple], TReturn]:
-    return lambda args: func(*args)
+    def apply_to_arguments(args: tuple) -> TReturn:
+        return func(*args)
+
+    apply_to_arguments.__name__ = f"apply({getattr(func, '__name__', func)})"
+    return apply_to_arguments
 
 
 TValue = TypeVar("TValue")
@@ -26,11 +47,12 @@ def do_print(phrase: str):
         print(phrase.format(value))
         return value
 
+    print_and_return_value.__name__ = "do_print"
     return print_and_return_value
 
 
 def do_pprint(obj: TValue) -> TValue:
-    pprint(obj)
+    pprint.pprint(obj)
     return obj
 
 
@@ -41,3 +63,333 @@ def log_return(func: Callable[..., TReturn]) -> Callable[..., TReturn]:
         return result
 
     return wrapper
+
+
+# absolute peaks observed by the memory measurements that are still running
+_enclosing_peaks: list[int] = []
+
+
+def measure_memory(func: Callable[..., TReturn], *args, **kwargs) -> tuple:
+    """
+
+    Args:
+        func: the function to measure, tracemalloc must be tracing
+        *args: the arguments of the function
+        **kwargs: the keyword arguments of the function
+
+    Returns:
+        the result of the function, the peak of the memory allocated during
+        the call and the memory still allocated after it, both in bytes
+
+    """
+    start_current, start_peak = tracemalloc.get_traced_memory()
+    if _enclosing_peaks:
+        _enclosing_peaks[-1] = max(_enclosing_peaks[-1], start_peak)
+    tracemalloc.reset_peak()
+    _enclosing_peaks.append(start_current)
+    try:
+        result = func(*args, **kwargs)
+    finally:
+        current, peak = tracemalloc.get_traced_memory()
+        absolute_peak = max(peak, _enclosing_peaks.pop())
+        if _enclosing_peaks:
+            _enclosing_peaks[-1] = max(_enclosing_peaks[-1], absolute_peak)
+    return result, absolute_peak - start_current, current - start_current
+
+
+def format_bytes(size: int) -> str:
+    for unit in ("B", "KiB", "MiB"):
+        if abs(size) < 1024:
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size:.1f}GiB"
+
+
+def log_memory(func: Callable[..., TReturn]) -> Callable[..., TReturn]:
+    def wrapper(*args, **kwargs):
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        try:
+            result, peak, net = measure_memory(func, *args, **kwargs)
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+        name = getattr(func, "__name__", func)
+        print(f"{name}: peak {format_bytes(peak)}, net {format_bytes(net)}")
+        return result
+
+    return wrapper
+
+
+@dataclass
+class StageStats:
+    calls: int = 0
+    wall_time: float = 0.0
+    output_size: int | None = None
+    peak_memory: int = 0
+    net_allocated: int = 0
+
+
+TRACE_STATS: dict[str, dict[str, StageStats]] = {}
+
+
+def get_argument_name(argument: Any) -> str:
+    if callable(argument):
+        return get_stage_name(argument)
+    if isinstance(argument, (int, float, str, bool)):
+        return repr(argument)
+    return type(argument).__name__
+
+
+def get_stage_name(func: Callable) -> str:
+    """
+
+    Args:
+        func: a pipeline stage
+
+    Returns:
+        a readable name for the stage, including the functions it was curried with
+
+    """
+    if isinstance(func, toolz.curry):
+        arguments = [get_argument_name(arg) for arg in func.args]
+        return f"{func.__name__}({', '.join(arguments)})"
+    if isinstance(func, partial):
+        return f"partial({get_stage_name(func.func)})"
+    if isinstance(func, toolz.juxt):
+        return f"juxt({', '.join(map(get_stage_name, func.funcs))})"
+    return getattr(func, "__name__", repr(func))
+
+
+def get_caller_label(depth: int = 2) -> str:
+    """
+
+    Args:
+        depth: how many frames up the caller is
+
+    Returns:
+        the name of the caller's module, or its file name when it runs as a script
+
+    """
+    caller_globals = sys._getframe(depth).f_globals
+    module_name = caller_globals.get("__name__", "")
+    if module_name == "__main__":
+        script = os.path.basename(caller_globals.get("__file__", module_name))
+        return script.removesuffix(".py")
+    return module_name.rsplit(".", 1)[-1]
+
+
+def trace_stage(label: str, func: Callable, *args, **kwargs) -> Any:
+    """
+
+    Args:
+        label: the name of the day the stage belongs to
+        func: the stage to call
+        *args: the arguments of the stage
+        **kwargs: the keyword arguments of the stage
+
+    Returns:
+        the output of the stage, after recording its wall time and output size,
+        and with AOC_TRACE_MEMORY=1 its peak memory and net allocations
+
+    """
+    start = time.perf_counter()
+    if TRACE_MEMORY:
+        result, peak, net = measure_memory(func, *args, **kwargs)
+    else:
+        result, peak, net = func(*args, **kwargs), 0, 0
+    elapsed = time.perf_counter() - start
+    stats = TRACE_STATS.setdefault(label, {}).setdefault(
+        get_stage_name(func), StageStats()
+    )
+    stats.calls += 1
+    stats.wall_time += elapsed
+    stats.peak_memory = max(stats.peak_memory, peak)
+    stats.net_allocated += net
+    stats.output_size = len(result) if isinstance(result, Sized) else None
+    return result
+
+
+class TracedCompose(Compose):
+    __slots__ = ("label",)
+
+    def __init__(self, funcs: tuple[Callable, ...], label: str):
+        super().__init__(tuple(reversed(funcs)))
+        self.label = label
+
+    def __call__(self, *args, **kwargs):
+        result = trace_stage(self.label, self.first, *args, **kwargs)
+        for func in self.funcs:
+            result = trace_stage(self.label, func, result)
+        return result
+
+
+def traced_compose_left(*funcs: Callable, label: str | None = None) -> Callable:
+    """
+    Drop-in for toolz.compose_left that records the wall time, the call count
+    and the output size of every stage. Lazy stages (ex: a curried map) only
+    create an iterator, so their work is timed in the stage consuming it.
+
+    Args:
+        *funcs: the stages of the pipeline
+        label: the name of the day, defaults to the caller's module
+
+    Returns:
+        the traced pipeline
+
+    """
+    if not funcs:
+        return identity
+    return TracedCompose(funcs, label or get_caller_label())
+
+
+def traced_pipe(data: Any, *funcs: Callable) -> Any:
+    """
+    Drop-in for toolz.pipe that records the stages like traced_compose_left
+
+    Args:
+        data: the input of the pipeline
+        *funcs: the stages of the pipeline
+
+    Returns:
+        the output of the last stage
+
+    """
+    label = get_caller_label()
+    for func in funcs:
+        data = trace_stage(label, func, data)
+    return data
+
+
+def format_trace_report(stats: dict[str, dict[str, StageStats]]) -> str:
+    """
+
+    Args:
+        stats: the recorded stage statistics of each day
+
+    Returns:
+        a table with the breakdown of the stages of each day
+
+    """
+    lines = []
+    for label, stages in stats.items():
+        lines.append(f"{label} pipeline stages (nested stages are counted twice)")
+        header = f"  {'stage':<48} {'calls':>7} {'wall(s)':>10} {'size':>10}"
+        if TRACE_MEMORY:
+            header += f" {'peak':>10} {'net':>10}"
+        lines.append(header)
+        for name, stage in stages.items():
+            size = "-" if stage.output_size is None else stage.output_size
+            row = (
+                f"  {name[:48]:<48} {stage.calls:>7} "
+                f"{stage.wall_time:>10.6f} {size:>10}"
+            )
+            if TRACE_MEMORY:
+                row += (
+                    f" {format_bytes(stage.peak_memory):>10}"
+                    f" {format_bytes(stage.net_allocated):>10}"
+                )
+            lines.append(row)
+    return "\n".join(lines)
+
+
+def print_trace_report() -> None:
+    if TRACE_STATS:
+        print(format_trace_report(TRACE_STATS), file=sys.stderr)
+
+
+compose_left = toolz.compose_left
+pipe = toolz.pipe
+
+
+def enable_tracing(memory: bool = False) -> None:
+    """
+    enable_tracing switch compose_left and pipe to their traced versions,
+    only the modules importing them after this call are traced
+
+    Args:
+        memory: whether to also trace the memory with tracemalloc
+
+    """
+    global TRACE_ENABLED, TRACE_MEMORY, compose_left, pipe
+    if memory and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if not TRACE_ENABLED:
+        atexit.register(print_trace_report)
+    TRACE_ENABLED, TRACE_MEMORY = True, TRACE_MEMORY or memory
+    compose_left, pipe = traced_compose_left, traced_pipe
+
+
+# Without AOC_TRACE=1 (or AOC_TRACE_MEMORY=1 to also trace the memory) the plain
+# toolz functions are used and tracing adds no overhead.
+if os.environ.get("AOC_TRACE_MEMORY", "0") != "0":
+    enable_tracing(memory=True)
+elif os.environ.get("AOC_TRACE", "0") != "0":
+    enable_tracing()
+
+
+def get_stages(pipeline: Callable) -> tuple[Callable, ...]:
+    """
+    get_stages get the stages of a pipeline built with compose_left
+
+    Args:
+        pipeline: a compose_left pipeline or any other callable
+
+    Returns:
+        the stages of the pipeline in the order they are applied,
+        or the callable itself as a single stage
+    """
+    if isinstance(pipeline, Compose):
+        return pipeline.first, *pipeline.funcs
+    return (pipeline,)
+
+
+def juxt_pipelines(*pipelines: Callable) -> Callable[..., tuple]:
+    """
+    juxt_pipelines like juxt, but evaluates the stages that all the pipelines
+    start with only once and feeds the shared result to the rest of each pipeline
+
+    Stages are shared when they are equal (curried functions with equal arguments
+    compare equal). A lazy iterator returned by the shared stages is materialized
+    to a list, and the remaining stages must not mutate the shared result.
+
+    Args:
+        *pipelines: compose_left pipelines applied to the same input
+
+    Returns:
+        a function that returns the tuple of the results of every pipeline
+    """
+    stages = [get_stages(pipeline) for pipeline in pipelines]
+    shared_length = 0
+    for column in zip(*stages):
+        if any(stage != column[0] for stage in column[1:]):
+            break
+        shared_length += 1
+
+    if not shared_length:
+        return lambda *args, **kwargs: tuple(
+            pipeline(*args, **kwargs) for pipeline in pipelines
+        )
+
+    label = getattr(pipelines[0], "label", None)
+    compose = (
+        partial(traced_compose_left, label=label)
+        if TRACE_ENABLED
+        else toolz.compose_left
+    )
+    shared = compose(*stages[0][:shared_length])
+    remainders = [
+        compose(*pipeline_stages[shared_length:])
+        if len(pipeline_stages) > shared_length
+        else identity
+        for pipeline_stages in stages
+    ]
+
+    def juxt_with_shared_stages(*args, **kwargs) -> tuple:
+        shared_result = shared(*args, **kwargs)
+        if isinstance(shared_result, Iterator):
+            shared_result = list(shared_result)
+        return tuple(remainder(shared_result) for remainder in remainders)
+
+    return juxt_with_shared_stages
@@ -1,9 +1,277 @@
+import functools
+import mmap
 import os
+import sys
+from contextlib import contextmanager
+from itertools import pairwise
+from typing import Callable, Iterator, TypeVar
+
+from utils.lazy import lazy_import
+
+hashlib = lazy_import("hashlib")
+pickle = lazy_import("pickle")
+
+SRC_DIR = os.path.join(os.path.dirname(__file__), "..")
+INPUTS_DIR = os.path.join(os.path.dirname(__file__), "../../inputs")
+CACHE_DIR = os.environ.get("AOC_CACHE_DIR") or os.path.join(
+    os.path.dirname(__file__), "../../.cache/parsed"
+)
+CACHE_MAX_BYTES = int(os.environ.get("AOC_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+CACHE_ENABLED = os.environ.get("AOC_PARSE_CACHE", "1") != "0"
+
+TParsed = TypeVar("TParsed")
+TBuffer = bytes | mmap.mmap
+
+
+def get_input_path(filename: str) -> str:
+    return os.path.join(INPUTS_DIR, filename)
 
 
 def read_inputs(filename: str) -> str:
-    dirname = os.path.dirname(__file__)
-    filepath = os.path.join(dirname, "../../inputs", filename)
+    filepath = get_input_path(filename)
     with open(filepath, "r") as f:
         text = f.read()
     return text.strip()
+
+
+@contextmanager
+def map_inputs(filename: str) -> Iterator[TBuffer]:
+    """
+    map_inputs memory-map an input file instead of reading it into memory,
+    `memoryview(buffer)` gives zero-copy access to its bytes
+
+    Args:
+        filename (str): the input file name, or an absolute path
+
+    Returns:
+        Iterator[TBuffer]: a context manager yielding the read-only mapped file
+        (an empty bytes object for an empty file)
+    """
+    with open(get_input_path(filename), "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def iter_lines(
+    buffer: TBuffer, start: int = 0, end: int | None = None
+) -> Iterator[bytes]:
+    """
+    iter_lines lazily split a buffer into lines, without their line feed
+
+    Args:
+        buffer (TBuffer): the buffer to split (ex: a file mapped by map_inputs)
+        start (int): the offset to start at
+        end (int | None): the offset to stop at, defaults to the end of the buffer
+
+    Returns:
+        Iterator[bytes]: the lines of the buffer
+    """
+    end = len(buffer) if end is None else end
+    position = start
+    while position < end:
+        line_end = buffer.find(b"\n", position, end)
+        if line_end == -1:
+            line_end = end
+        yield buffer[position:line_end]
+        position = line_end + 1
+
+
+def iter_paragraphs(
+    buffer: TBuffer, start: int = 0, end: int | None = None
+) -> Iterator[bytes]:
+    """
+    iter_paragraphs lazily split a buffer into the paragraphs separated by blank lines
+
+    Args:
+        buffer (TBuffer): the buffer to split (ex: a file mapped by map_inputs)
+        start (int): the offset to start at
+        end (int | None): the offset to stop at, defaults to the end of the buffer
+
+    Returns:
+        Iterator[bytes]: the non-empty paragraphs, without the surrounding line feeds
+    """
+    end = len(buffer) if end is None else end
+    position = start
+    while position < end:
+        paragraph_end = buffer.find(b"\n\n", position, end)
+        if paragraph_end == -1:
+            paragraph_end = end
+        paragraph = buffer[position:paragraph_end].strip(b"\n")
+        if paragraph:
+            yield paragraph
+        position = paragraph_end + 2
+
+
+def split_byte_ranges(
+    buffer: TBuffer, parts: int, separator: bytes = b"\n\n"
+) -> list[tuple[int, int]]:
+    """
+    split_byte_ranges split a buffer into about equal byte ranges that each start
+    right after a separator, so no record (ex: a paragraph) spans two ranges
+
+    Args:
+        buffer (TBuffer): the buffer to split (ex: a file mapped by map_inputs)
+        parts (int): the number of ranges wanted
+        separator (bytes): the separator of the records, a blank line by default
+
+    Returns:
+        list[tuple[int, int]]: the start and end offsets of the ranges, fewer than
+        parts when the records are too large to split the buffer further
+    """
+    size = len(buffer)
+    boundaries = [0]
+    for part in range(1, parts):
+        boundary = buffer.find(separator, max(size * part // parts, boundaries[-1]))
+        if boundary == -1:
+            break
+        boundaries.append(boundary + len(separator))
+    boundaries.append(size)
+    return [(start, end) for start, end in pairwise(boundaries) if start < end]
+
+
+@functools.cache
+def get_module_id(module_name: str) -> str:
+    """
+    get_module_id name a module after its file, so a day run as a script is
+    not named __main__ like every other script
+
+    Args:
+        module_name (str): the name of an imported module
+
+    Returns:
+        str: the module name, or for __main__ the dotted path of its file under
+        src followed by ".__main__" (ex: "solutions.day5.__main__"), since its
+        pickled classes only load back in a script run
+    """
+    if module_name != "__main__":
+        return module_name
+    module = sys.modules[module_name]
+    if module.__spec__ is not None:
+        # run with python -m
+        return f"{module.__spec__.name}.__main__"
+    relative_path = os.path.relpath(os.path.abspath(module.__file__ or ""), SRC_DIR)
+    return relative_path.removesuffix(".py").replace(os.sep, ".") + ".__main__"
+
+
+@functools.cache
+def get_source_digest(module_name: str) -> str:
+    """
+    get_source_digest hash the source file of a module along with the sources
+    of the utils package, which the parsers of the days build on
+
+    Args:
+        module_name (str): the name of an imported module
+
+    Returns:
+        str: the hex digest of the module's source file and the utils sources
+    """
+    utils_paths = sorted(
+        entry.path
+        for entry in os.scandir(os.path.dirname(__file__))
+        if entry.name.endswith(".py")
+    )
+    digest = hashlib.sha256()
+    for path in [sys.modules[module_name].__file__ or "", *utils_paths]:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def evict_least_recently_used(cache_dir: str, max_bytes: int) -> None:
+    """
+    evict_least_recently_used delete the least recently used cache entries
+    until the cache fits in the size limit
+
+    Args:
+        cache_dir (str): the cache directory
+        max_bytes (int): the maximum total size of the cache entries
+    """
+    with os.scandir(cache_dir) as entries:
+        files = [(entry.stat(), entry.path) for entry in entries if entry.is_file()]
+    total_size = sum(stats.st_size for stats, _ in files)
+    for stats, path in sorted(files, key=lambda file: file[0].st_mtime):
+        if total_size <= max_bytes:
+            break
+        os.remove(path)
+        total_size -= stats.st_size
+
+
+def set_parse_cache(enabled: bool) -> None:
+    """
+    set_parse_cache switch the parse cache on or off for this process
+
+    Args:
+        enabled (bool): whether the cached parsers should use the cache
+    """
+    global CACHE_ENABLED
+    CACHE_ENABLED = enabled
+
+
+def write_cache_entry(path: str, entry: tuple) -> None:
+    """
+    write_cache_entry atomically write a cache entry
+
+    Args:
+        path (str): the path of the cache entry
+        entry (tuple): the source digest and the parsed value
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temporary_path, "wb") as f:
+            pickle.dump(entry, f, pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary_path, path)
+    except BaseException:
+        os.remove(temporary_path)
+        raise
+
+
+def cached_parser(parser: Callable[[str], TParsed]) -> Callable[[str], TParsed]:
+    """
+    cached_parser store the parser's output on disk and reuse it
+    the next time the parser is called with the same input
+
+    Entries are keyed by the parser's module and name plus a hash of the input.
+    They are invalidated when the source file of the parser or the utils
+    package changes and the least recently used ones are evicted above
+    AOC_CACHE_MAX_BYTES.
+    Set AOC_PARSE_CACHE=0 to disable the cache.
+
+    Args:
+        parser: a function parsing the raw input text
+
+    Returns:
+        the parser, reading its output from the cache when possible
+    """
+    module_name = parser.__module__
+    parser_id = f"{get_module_id(module_name)}.{parser.__qualname__}"
+
+    @functools.wraps(parser)
+    def parse_with_cache(text: str) -> TParsed:
+        if not CACHE_ENABLED:
+            return parser(text)
+        source_digest = get_source_digest(module_name)
+        input_digest = hashlib.sha256(text.encode()).hexdigest()
+        path = os.path.join(CACHE_DIR, f"{parser_id}-{input_digest}.pickle")
+        try:
+            with open(path, "rb") as f:
+                cached_digest, parsed = pickle.load(f)
+            if cached_digest == source_digest:
+                os.utime(path)
+                return parsed
+        except Exception:
+            # a missing, corrupted or no longer loadable entry is a cache miss
+            pass
+
+        parsed = parser(text)
+        try:
+            write_cache_entry(path, (source_digest, parsed))
+            evict_least_recently_used(CACHE_DIR, CACHE_MAX_BYTES)
+        except (OSError, pickle.PicklingError, RecursionError, TypeError):
+            pass
+        return parsed
+
+    return parse_with_cache
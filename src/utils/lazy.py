@@ -0,0 +1,94 @@
+import importlib
+import importlib.util
+import sys
+from types import ModuleType
+from typing import Any, Callable
+
+
+def lazy_import(name: str) -> ModuleType:
+    """
+    lazy_import import a module whose body only runs when one of its attributes
+    is first accessed
+
+    Args:
+        name (str): the full name of the module (ex: "tracemalloc")
+
+    Returns:
+        ModuleType: the module, loaded on first attribute access
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+class LazyCallable:
+    """
+    A function of a module that is only imported when the function is first called
+
+    Lazy callables of the same function compare equal, so they can be shared
+    by juxt_pipelines like the function itself.
+    """
+
+    def __init__(self, module_name: str, name: str):
+        self.__module__ = module_name
+        self.__name__ = self.__qualname__ = name
+        self.func: Callable | None = None
+
+    def resolve(self) -> Callable:
+        if self.func is None:
+            module = importlib.import_module(self.__module__)
+            self.func = getattr(module, self.__name__)
+        return self.func
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.resolve()(*args, **kwargs)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, LazyCallable) and (
+            self.__module__,
+            self.__name__,
+        ) == (other.__module__, other.__name__)
+
+    def __hash__(self) -> int:
+        return hash((self.__module__, self.__name__))
+
+    def __repr__(self) -> str:
+        return f"lazy_callable({self.__module__!r}, {self.__name__!r})"
+
+
+def lazy_callable(module_name: str, name: str) -> LazyCallable:
+    """
+    lazy_callable refer to a function of a module without importing the module
+
+    Args:
+        module_name (str): the module defining the function (ex: "more_itertools")
+        name (str): the name of the function (ex: "ilen")
+
+    Returns:
+        LazyCallable: a callable importing the module on its first call
+    """
+    return LazyCallable(module_name, name)
+
+
+def optional_import(name: str) -> ModuleType | None:
+    """
+    optional_import lazily import an optional dependency if it is installed
+
+    Args:
+        name (str): the full name of the module (ex: "numpy")
+
+    Returns:
+        ModuleType | None: the module, loaded on first attribute access,
+        or None if it is not installed
+    """
+    if name not in sys.modules and importlib.util.find_spec(name) is None:
+        return None
+    return lazy_import(name)
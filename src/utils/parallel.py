@@ -0,0 +1,13 @@
+import os
+
+
+def get_available_cores() -> int:
+    """
+    get_available_cores count the cores this process is allowed to run on
+
+    Returns:
+        int: the number of usable cores
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
@@ -0,0 +1,186 @@
+import mmap
+import re
+from array import array
+from typing import Any, Iterator
+
+from utils.lazy import optional_import
+
+np = optional_import("numpy")
+
+TText = str | bytes | bytearray | memoryview | mmap.mmap
+
+# Every byte that is not a digit becomes a space, so the digits runs are split
+# by bytes.split without a regex and converted by int straight from bytes
+DIGITS_ONLY = bytes(
+    byte if ord("0") <= byte <= ord("9") else ord(" ") for byte in range(256)
+)
+# Same as DIGITS_ONLY but the line feeds are kept, to check the records per line
+LINE_DIGITS_ONLY = DIGITS_ONLY[: ord("\n")] + b"\n" + DIGITS_ONLY[ord("\n") + 1 :]
+# A line feed becomes a NUL token, since bytes.split would drop a bare line feed
+LINE_END = b"\0"
+NOT_LETTERS = bytes(
+    byte
+    for byte in range(256)
+    if not (chr(byte).isascii() and chr(byte).isalpha())
+)
+# A minus sign only makes a negative number when it does not follow a digit,
+# so "1-10" is 1 and 10 but "x=-10" is -10
+SIGNED_INT_PATTERN = re.compile(rb"(?<![0-9])-?[0-9]+")
+
+
+def to_bytes(text: TText) -> bytes:
+    """
+    to_bytes get the bytes of an input without copying it when it already is bytes
+
+    Args:
+        text (TText): the input as text, bytes or a buffer
+
+    Returns:
+        bytes: the bytes of the input
+    """
+    if isinstance(text, bytes):
+        return text
+    if isinstance(text, str):
+        return text.encode()
+    return bytes(text)
+
+
+def extract_ints(text: TText, signed: bool = False) -> array:
+    """
+    extract_ints extract every integer of an input in bulk
+
+    Args:
+        text (TText): the input as text, bytes or a buffer
+        signed (bool): whether a minus sign before a number makes it negative,
+        off by default since the inputs mostly use "-" as a separator
+
+    Returns:
+        array: the integers, in order, as an array('q') of 64 bits integers
+    """
+    buffer = to_bytes(text)
+    if signed:
+        return array("q", map(int, SIGNED_INT_PATTERN.findall(buffer)))
+    return array("q", map(int, buffer.translate(DIGITS_ONLY).split()))
+
+
+def extract_int_groups(text: TText, separator: bytes = b"\n\n") -> list[array]:
+    """
+    extract_int_groups extract the integers of an input made of groups of lines
+    with one integer per line (ex: paragraphs separated by blank lines)
+
+    Every line is converted by int straight from bytes, so a line that does not
+    hold exactly one integer raises instead of shifting the following groups.
+
+    Args:
+        text (TText): the input as text, bytes or a buffer
+        separator (bytes): the separator of the groups, a blank line by default
+
+    Returns:
+        list[array]: the integers of each group
+
+    Raises:
+        ValueError: if a line of a group is not an integer
+    """
+    groups = to_bytes(text).strip().split(separator)
+    return [array("q", map(int, group.splitlines())) for group in groups]
+
+
+def extract_letters(text: TText) -> str:
+    """
+    extract_letters extract every ASCII letter of an input, in order
+
+    Args:
+        text (TText): the input as text, bytes or a buffer
+
+    Returns:
+        str: the letters of the input
+    """
+    return to_bytes(text).translate(None, NOT_LETTERS).decode("ascii")
+
+
+def split_lines_tokens(text: TText, width: int) -> list[bytes]:
+    """
+    split_lines_tokens split an input into its whitespace separated tokens, in bulk,
+    checking that every line holds exactly width of them
+
+    Args:
+        text (TText): the input as text, bytes or a buffer
+        width (int): the number of tokens of a line
+
+    Returns:
+        list[bytes]: the tokens of every line, in order
+
+    Raises:
+        ValueError: if a line does not hold exactly width tokens
+    """
+    buffer = to_bytes(text).strip()
+    if not buffer:
+        return []
+    tokens = buffer.replace(b"\n", b" " + LINE_END + b" ").split()
+    tokens.append(LINE_END)
+    line_ends = tokens[width :: width + 1]
+    if len(tokens) % (width + 1) or line_ends.count(LINE_END) != len(line_ends):
+        raise ValueError(f"Every line of the input must hold {width} values")
+    del tokens[width :: width + 1]
+    return tokens
+
+
+def iter_records(values: array, width: int) -> Iterator[tuple[int, ...]]:
+    """
+    iter_records group a flat sequence of integers into fixed-size records
+    (ex: the 4 bounds of "2-4,6-8" or the 3 numbers of "move 1 from 2 to 1")
+
+    Args:
+        values (array): the integers extracted from the input
+        width (int): the number of integers in a record
+
+    Returns:
+        Iterator[tuple[int, ...]]: the records
+
+    Raises:
+        ValueError: if the integers do not split evenly into records
+    """
+    if len(values) % width:
+        raise ValueError(f"{len(values)} integers do not make records of {width}")
+    return zip(*[iter(values)] * width)
+
+
+def extract_records(text: TText, width: int) -> list[tuple[int, ...]]:
+    """
+    extract_records extract the integers of an input made of one fixed-size record
+    per line
+
+    Args:
+        text (TText): the input as text, bytes or a buffer
+        width (int): the number of integers in a record
+
+    Returns:
+        list[tuple[int, ...]]: the records
+
+    Raises:
+        ValueError: if a line does not hold exactly width integers
+    """
+    buffer = to_bytes(text).translate(LINE_DIGITS_ONLY)
+    values = array("q", map(int, split_lines_tokens(buffer, width)))
+    return list(iter_records(values, width))
+
+
+def to_numpy(values: array, width: int | None = None) -> Any:
+    """
+    to_numpy view the extracted integers as a NumPy array, without copying them
+
+    Args:
+        values (array): the integers extracted from the input
+        width (int | None): the number of integers in a record, to get one row
+        per record
+
+    Returns:
+        numpy.ndarray: the int64 array, of shape (n,) or (n / width, width)
+
+    Raises:
+        ModuleNotFoundError: if NumPy is not installed
+    """
+    if np is None:
+        raise ModuleNotFoundError("NumPy is not installed", name="numpy")
+    view = np.frombuffer(values, dtype=np.int64)
+    return view if width is None else view.reshape(-1, width)